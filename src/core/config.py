@@ -156,6 +156,8 @@ class Settings(BaseSettings):
     enable_security_monitoring: bool = Field(default=True, description="Enable security monitoring")
     max_request_size_mb: int = Field(default=10, description="Maximum request size in MB")
     rate_limit_per_minute: int = Field(default=100, description="Rate limit per minute per user")
+    mcp_max_batch_size: int = Field(default=50, description="Maximum JSON-RPC messages per batch request")
+    mcp_batch_concurrency: int = Field(default=8, description="Maximum batch messages run concurrently")
     
     # Monitoring
     enable_metrics: bool = Field(default=True, description="Enable metrics collection")
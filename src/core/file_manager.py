@@ -17,8 +17,8 @@ class SecureFileManager:
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
     
-    async def read_project_file(self, project_id: str, file_path: str) -> str:
-        """Read a file from a project"""
+    def resolve_project_file(self, project_id: str, file_path: str) -> Path:
+        """Return the path of a file in a project, rejecting paths outside it"""
         project_dir = self.base_path / project_id
         target_file = project_dir / file_path
         
@@ -26,6 +26,12 @@ class SecureFileManager:
         if not self._is_safe_path(target_file, project_dir):
             raise ValueError(f"Unsafe file path: {file_path}")
         
+        return target_file
+    
+    async def read_project_file(self, project_id: str, file_path: str) -> str:
+        """Read a file from a project"""
+        target_file = self.resolve_project_file(project_id, file_path)
+        
         if not target_file.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
@@ -3,7 +3,7 @@ Core MCP server implementation with full protocol compliance
 """
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, KeysView
 from dataclasses import dataclass, asdict
 from enum import Enum
 import structlog
@@ -15,6 +15,21 @@ from src.core.config import settings
 
 logger = structlog.get_logger()
 
+# JSON-RPC error codes reported for batch entries that fail with an HTTP error
+JSONRPC_ERROR_CODES = {
+    400: -32600,  # Invalid request
+    404: -32602,  # Unknown tool or resource
+    500: -32603   # Internal error
+}
+
+
+def _invalid_request_error(data: Optional[str] = None) -> Dict[str, Any]:
+    """JSON-RPC error object for a message that is not a valid request"""
+    error: Dict[str, Any] = {"code": -32600, "message": "Invalid Request"}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": None, "error": error}
+
 
 class MCPMessageType(Enum):
     """MCP message types according to specification"""
@@ -92,6 +107,8 @@ class MCPServer:
         self.tools: Dict[str, Callable] = {}
         self.resources: Dict[str, Callable] = {}
         self.prompts: Dict[str, Callable] = {}
+        # tools/list entries, rebuilt on the first listing after a registration
+        self._tools_list_cache: Optional[Tuple[Dict[str, Any], ...]] = None
         self.capabilities = MCPCapabilities(
             experimental={},
             logging={},
@@ -103,6 +120,12 @@ class MCPServer:
             name="autonomous-software-foundry",
             version="1.0.0"
         )
+        # Initialize result is fixed once the server is configured
+        self._initialize_result = {
+            "protocolVersion": "2024-11-05",
+            "capabilities": asdict(self.capabilities),
+            "serverInfo": asdict(self.server_info)
+        }
         self._setup_routes()
     
     def _setup_routes(self):
@@ -111,231 +134,316 @@ class MCPServer:
         @self.app.post("/mcp/initialize")
         async def initialize(request: Request):
             """MCP initialization handshake"""
-            try:
-                body = await request.json()
-                
-                # Validate initialization request
-                if body.get("method") != "initialize":
-                    logger.error("mcp_initialization_failed", error="Invalid initialization method")
-                    raise HTTPException(status_code=400, detail="Invalid initialization method")
-                
-                # Extract client capabilities
-                client_capabilities = body.get("params", {}).get("capabilities", {})
-                client_info = body.get("params", {}).get("clientInfo", {})
-                
-                logger.info(
-                    "mcp_client_initialized",
-                    client_name=client_info.get("name", "unknown"),
-                    client_version=client_info.get("version", "unknown"),
-                    client_capabilities=list(client_capabilities.keys())
-                )
-                
-                # Return server capabilities
-                return {
-                    "jsonrpc": "2.0",
-                    "id": body.get("id"),
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": asdict(self.capabilities),
-                        "serverInfo": asdict(self.server_info)
-                    }
-                }
-                
-            except HTTPException:
-                # Re-raise HTTP exceptions as-is
-                raise
-            except Exception as e:
-                logger.error("mcp_initialization_failed", error=str(e))
-                raise HTTPException(status_code=500, detail=f"Initialization failed: {str(e)}")
+            return await self._dispatch(request, self._handle_initialize)
         
         @self.app.post("/mcp/tools/list")
         async def list_tools(request: Request):
             """List available MCP tools"""
-            try:
-                body = await request.json()
-                
-                tools_list = []
-                for name, tool_func in self.tools.items():
-                    if hasattr(tool_func, '_mcp_tool_info'):
-                        tool_info = tool_func._mcp_tool_info
-                        tools_list.append({
-                            "name": name,
-                            "description": tool_info.description,
-                            "inputSchema": tool_info.inputSchema
-                        })
-                
-                logger.info("mcp_tools_listed", tools_count=len(tools_list))
-                
-                return {
-                    "jsonrpc": "2.0",
-                    "id": body.get("id"),
-                    "result": {
-                        "tools": tools_list
-                    }
-                }
-                
-            except HTTPException:
-                # Re-raise HTTP exceptions as-is  
-                raise
-            except Exception as e:
-                logger.error("mcp_tools_list_failed", error=str(e))
-                raise HTTPException(status_code=500, detail=f"Failed to list tools: {str(e)}")
+            return await self._dispatch(request, self._handle_list_tools)
         
         @self.app.post("/mcp/tools/call")
         async def call_tool(request: Request):
             """Execute MCP tool call"""
-            try:
-                body = await request.json()
-                params = body.get("params", {})
-                tool_name = params.get("name")
-                tool_arguments = params.get("arguments", {})
-                
-                if not tool_name or tool_name not in self.tools:
-                    logger.error("mcp_tool_call_failed", error=f"Tool '{tool_name}' not found")
-                    raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
-                
-                # Get correlation ID from request state
-                correlation_id = getattr(request.state, 'correlation_id', 'unknown')
-                
-                logger.info(
-                    "mcp_tool_called",
-                    tool_name=tool_name,
-                    arguments_keys=list(tool_arguments.keys()),
-                    correlation_id=correlation_id
-                )
-                
-                # Execute tool
-                tool_func = self.tools[tool_name]
-                try:
-                    result = await tool_func(request, **tool_arguments)
-                    
-                    # Format result according to MCP spec
-                    if isinstance(result, dict) and "content" in result:
-                        tool_result = result
-                    else:
-                        tool_result = {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": json.dumps(result, indent=2, default=str)
-                                }
-                            ]
-                        }
-                    
-                    logger.info(
-                        "mcp_tool_completed",
-                        tool_name=tool_name,
-                        correlation_id=correlation_id,
-                        success=True
-                    )
-                    
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id"),
-                        "result": tool_result
-                    }
-                    
-                except Exception as tool_error:
-                    logger.error(
-                        "mcp_tool_execution_failed",
-                        tool_name=tool_name,
-                        error=str(tool_error),
-                        correlation_id=correlation_id
-                    )
-                    
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id"),
-                        "result": {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"Tool execution failed: {str(tool_error)}"
-                                }
-                            ],
-                            "isError": True
-                        }
-                    }
-                
-            except HTTPException:
-                # Re-raise HTTP exceptions as-is
-                raise  
-            except Exception as e:
-                logger.error("mcp_tool_call_failed", error=str(e))
-                raise HTTPException(status_code=500, detail=f"Tool call failed: {str(e)}")
+            return await self._dispatch(request, self._handle_call_tool)
         
-        @self.app.post("/mcp/resources/list") 
+        @self.app.post("/mcp/resources/list")
         async def list_resources(request: Request):
             """List available MCP resources"""
-            try:
-                body = await request.json()
-                
-                resources_list = []
-                for uri, resource_func in self.resources.items():
-                    if hasattr(resource_func, '_mcp_resource_info'):
-                        resource_info = resource_func._mcp_resource_info
-                        resources_list.append({
-                            "uri": uri,
-                            "name": resource_info.name,
-                            "description": resource_info.description,
-                            "mimeType": resource_info.mimeType
-                        })
-                
-                logger.info("mcp_resources_listed", resources_count=len(resources_list))
-                
-                return {
-                    "jsonrpc": "2.0", 
-                    "id": body.get("id"),
-                    "result": {
-                        "resources": resources_list
-                    }
-                }
-                
-            except HTTPException:
-                # Re-raise HTTP exceptions as-is
-                raise
-            except Exception as e:
-                logger.error("mcp_resources_list_failed", error=str(e))
-                raise HTTPException(status_code=500, detail=f"Failed to list resources: {str(e)}")
+            return await self._dispatch(request, self._handle_list_resources)
         
         @self.app.post("/mcp/resources/read")
         async def read_resource(request: Request):
             """Read MCP resource content"""
+            return await self._dispatch(request, self._handle_read_resource)
+    
+    async def _dispatch(self, request: Request, handler: Callable) -> Any:
+        """Run a JSON-RPC message, or each message of a batch array, through handler"""
+        try:
+            body = await request.json()
+        except Exception as e:
+            logger.error("mcp_request_parse_failed", error=str(e))
+            raise HTTPException(status_code=400, detail=f"Invalid JSON-RPC payload: {str(e)}")
+        
+        if not isinstance(body, list):
+            return await handler(request, body)
+        
+        if not body:
+            return _invalid_request_error()
+        
+        # One POST passes the per-request middleware (rate limiting) once,
+        # so cap how much work a single batch can start
+        if len(body) > settings.mcp_max_batch_size:
+            logger.warning("mcp_batch_rejected", batch_size=len(body), limit=settings.mcp_max_batch_size)
+            return _invalid_request_error(
+                f"Batch of {len(body)} messages exceeds the limit of {settings.mcp_max_batch_size}"
+            )
+        
+        # Batch entries are independent, so run them concurrently up to a bound
+        semaphore = asyncio.Semaphore(settings.mcp_batch_concurrency)
+        
+        async def run_bounded(item: Any) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._dispatch_batch_item(request, handler, item)
+        
+        responses = await asyncio.gather(*(run_bounded(item) for item in body))
+        
+        # Notifications (entries without an id) still run but get no response,
+        # and a batch of only notifications gets no body at all
+        responses = [
+            response for item, response in zip(body, responses)
+            if not (isinstance(item, dict) and "id" not in item)
+        ]
+        return responses if responses else Response(status_code=204)
+    
+    async def _dispatch_batch_item(
+        self,
+        request: Request,
+        handler: Callable,
+        item: Any
+    ) -> Dict[str, Any]:
+        """Run one batch entry, reporting failures as a JSON-RPC error object"""
+        if not isinstance(item, dict):
+            return _invalid_request_error()
+        
+        try:
+            return await handler(request, item)
+        except HTTPException as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": item.get("id"),
+                "error": {
+                    "code": JSONRPC_ERROR_CODES.get(e.status_code, -32603),
+                    "message": e.detail
+                }
+            }
+    
+    async def _handle_initialize(self, request: Request, body: Dict[str, Any]) -> Dict[str, Any]:
+        """MCP initialization handshake"""
+        try:
+            # Validate initialization request
+            if body.get("method") != "initialize":
+                logger.error("mcp_initialization_failed", error="Invalid initialization method")
+                raise HTTPException(status_code=400, detail="Invalid initialization method")
+            
+            # Extract client capabilities
+            client_capabilities = body.get("params", {}).get("capabilities", {})
+            client_info = body.get("params", {}).get("clientInfo", {})
+            
+            logger.info(
+                "mcp_client_initialized",
+                client_name=client_info.get("name", "unknown"),
+                client_version=client_info.get("version", "unknown"),
+                client_capabilities=list(client_capabilities.keys())
+            )
+            
+            # Return server capabilities
+            return {
+                "jsonrpc": "2.0",
+                "id": body.get("id"),
+                "result": self._initialize_result
+            }
+            
+        except HTTPException:
+            # Re-raise HTTP exceptions as-is
+            raise
+        except Exception as e:
+            logger.error("mcp_initialization_failed", error=str(e))
+            raise HTTPException(status_code=500, detail=f"Initialization failed: {str(e)}")
+    
+    async def _handle_list_tools(self, request: Request, body: Dict[str, Any]) -> Dict[str, Any]:
+        """List available MCP tools"""
+        try:
+            tools_list = self._list_tools()
+            
+            logger.info("mcp_tools_listed", tools_count=len(tools_list))
+            
+            return {
+                "jsonrpc": "2.0",
+                "id": body.get("id"),
+                "result": {
+                    "tools": tools_list
+                }
+            }
+            
+        except HTTPException:
+            # Re-raise HTTP exceptions as-is  
+            raise
+        except Exception as e:
+            logger.error("mcp_tools_list_failed", error=str(e))
+            raise HTTPException(status_code=500, detail=f"Failed to list tools: {str(e)}")
+    
+    def _list_tools(self) -> List[Dict[str, Any]]:
+        """Return tools/list entries, built once per registry change"""
+        if self._tools_list_cache is None:
+            self._tools_list_cache = tuple(
+                {
+                    "name": name,
+                    "description": tool_func._mcp_tool_info.description,
+                    "inputSchema": tool_func._mcp_tool_info.inputSchema
+                }
+                for name, tool_func in self.tools.items()
+                if hasattr(tool_func, '_mcp_tool_info')
+            )
+        
+        # Callers get their own entries so the cached ones cannot be mutated
+        return [dict(entry) for entry in self._tools_list_cache]
+    
+    def invalidate_caches(self) -> None:
+        """Drop data derived from the registries
+        
+        Registration methods do this themselves; call it after editing
+        ``tools`` directly.
+        """
+        self._tools_list_cache = None
+    
+    async def _handle_call_tool(self, request: Request, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute MCP tool call"""
+        try:
+            params = body.get("params", {})
+            tool_name = params.get("name")
+            tool_arguments = params.get("arguments", {})
+            tool_func = self.tools.get(tool_name) if tool_name else None
+            
+            if tool_func is None:
+                logger.error("mcp_tool_call_failed", error=f"Tool '{tool_name}' not found")
+                raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+            
+            # Get correlation ID from request state
+            correlation_id = getattr(request.state, 'correlation_id', 'unknown')
+            
+            logger.info(
+                "mcp_tool_called",
+                tool_name=tool_name,
+                arguments_keys=list(tool_arguments.keys()),
+                correlation_id=correlation_id
+            )
+            
+            # Execute tool
             try:
-                body = await request.json()
-                params = body.get("params", {})
-                resource_uri = params.get("uri")
-                
-                if not resource_uri or resource_uri not in self.resources:
-                    logger.error("mcp_resource_read_failed", error=f"Resource '{resource_uri}' not found")
-                    raise HTTPException(status_code=404, detail=f"Resource '{resource_uri}' not found")
+                result = await tool_func(request, **tool_arguments)
                 
-                correlation_id = getattr(request.state, 'correlation_id', 'unknown')
+                # Format result according to MCP spec
+                if isinstance(result, dict) and "content" in result:
+                    tool_result = result
+                else:
+                    tool_result = {
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": json.dumps(result, indent=2, default=str)
+                            }
+                        ]
+                    }
                 
                 logger.info(
-                    "mcp_resource_read",
-                    resource_uri=resource_uri,
-                    correlation_id=correlation_id
+                    "mcp_tool_completed",
+                    tool_name=tool_name,
+                    correlation_id=correlation_id,
+                    success=True
                 )
                 
-                # Read resource
-                resource_func = self.resources[resource_uri]
-                content = await resource_func(request)
+                return {
+                    "jsonrpc": "2.0",
+                    "id": body.get("id"),
+                    "result": tool_result
+                }
+                
+            except Exception as tool_error:
+                logger.error(
+                    "mcp_tool_execution_failed",
+                    tool_name=tool_name,
+                    error=str(tool_error),
+                    correlation_id=correlation_id
+                )
                 
                 return {
                     "jsonrpc": "2.0",
                     "id": body.get("id"),
                     "result": {
-                        "contents": content if isinstance(content, list) else [content]
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": f"Tool execution failed: {str(tool_error)}"
+                            }
+                        ],
+                        "isError": True
                     }
                 }
-                
-            except HTTPException:
-                # Re-raise HTTP exceptions as-is
-                raise
-            except Exception as e:
-                logger.error("mcp_resource_read_failed", error=str(e))
-                raise HTTPException(status_code=500, detail=f"Resource read failed: {str(e)}")
+            
+        except HTTPException:
+            # Re-raise HTTP exceptions as-is
+            raise  
+        except Exception as e:
+            logger.error("mcp_tool_call_failed", error=str(e))
+            raise HTTPException(status_code=500, detail=f"Tool call failed: {str(e)}")
+    
+    async def _handle_list_resources(self, request: Request, body: Dict[str, Any]) -> Dict[str, Any]:
+        """List available MCP resources"""
+        try:
+            resources_list = []
+            for uri, resource_func in self.resources.items():
+                if hasattr(resource_func, '_mcp_resource_info'):
+                    resource_info = resource_func._mcp_resource_info
+                    resources_list.append({
+                        "uri": uri,
+                        "name": resource_info.name,
+                        "description": resource_info.description,
+                        "mimeType": resource_info.mimeType
+                    })
+            
+            logger.info("mcp_resources_listed", resources_count=len(resources_list))
+            
+            return {
+                "jsonrpc": "2.0", 
+                "id": body.get("id"),
+                "result": {
+                    "resources": resources_list
+                }
+            }
+            
+        except HTTPException:
+            # Re-raise HTTP exceptions as-is
+            raise
+        except Exception as e:
+            logger.error("mcp_resources_list_failed", error=str(e))
+            raise HTTPException(status_code=500, detail=f"Failed to list resources: {str(e)}")
+    
+    async def _handle_read_resource(self, request: Request, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Read MCP resource content"""
+        try:
+            params = body.get("params", {})
+            resource_uri = params.get("uri")
+            resource_func = self.resources.get(resource_uri) if resource_uri else None
+            
+            if resource_func is None:
+                logger.error("mcp_resource_read_failed", error=f"Resource '{resource_uri}' not found")
+                raise HTTPException(status_code=404, detail=f"Resource '{resource_uri}' not found")
+            
+            correlation_id = getattr(request.state, 'correlation_id', 'unknown')
+            
+            logger.info(
+                "mcp_resource_read",
+                resource_uri=resource_uri,
+                correlation_id=correlation_id
+            )
+            
+            # Read resource
+            content = await resource_func(request)
+            
+            return {
+                "jsonrpc": "2.0",
+                "id": body.get("id"),
+                "result": {
+                    "contents": content if isinstance(content, list) else [content]
+                }
+            }
+            
+        except HTTPException:
+            # Re-raise HTTP exceptions as-is
+            raise
+        except Exception as e:
+            logger.error("mcp_resource_read_failed", error=str(e))
+            raise HTTPException(status_code=500, detail=f"Resource read failed: {str(e)}")
     
     def register_tool(
         self, 
@@ -346,16 +454,7 @@ class MCPServer:
     ):
         """Decorator to register MCP tools"""
         def decorator(func: Callable):
-            # Store tool metadata
-            func._mcp_tool_info = MCPTool(
-                name=name,
-                description=description,
-                inputSchema=input_schema
-            )
-            func._required_scopes = required_scopes or []
-            
-            # Register tool
-            self.tools[name] = func
+            self._register_tool_raw(func, name, description, input_schema, required_scopes)
             
             logger.info(
                 "mcp_tool_registered",
@@ -366,6 +465,53 @@ class MCPServer:
             return func
         return decorator
     
+    def register_tools_bulk(self, specs: List[tuple]) -> None:
+        """Register many tools in one pass
+        
+        Each spec is a ``(func, registration)`` pair where registration holds
+        the register_tool keyword arguments.
+        """
+        for func, registration in specs:
+            self._register_tool_raw(
+                func,
+                registration['name'],
+                registration['description'],
+                registration['input_schema'],
+                registration.get('required_scopes')
+            )
+        
+        logger.info(
+            "mcp_tools_registered",
+            tool_names=[registration['name'] for _, registration in specs]
+        )
+    
+    def _register_tool_raw(
+        self,
+        func: Callable,
+        name: str,
+        description: str,
+        input_schema: Dict[str, Any],
+        required_scopes: Optional[List[str]]
+    ) -> None:
+        """Attach tool metadata to func and add it to the registry"""
+        func._mcp_tool_info = MCPTool(
+            name=name,
+            description=description,
+            inputSchema=input_schema
+        )
+        func._required_scopes = required_scopes or []
+        self.tools[name] = func
+        self._tools_list_cache = None
+    
+    @property
+    def tool_names(self) -> KeysView[str]:
+        """Set-like live view of registered tool names
+        
+        A keys view stays in sync with the registry however tools are added
+        or removed, and supports O(1) membership and subset checks.
+        """
+        return self.tools.keys()
+    
     def register_resource(
         self,
         uri: str,
@@ -33,12 +33,14 @@ def mcp_tool(
         # Generate JSON schema from function signature
         input_schema = _generate_input_schema(func)
         
+        # Build the scope checker once rather than on every call
+        auth_dependency = require_scopes(*required_scopes) if required_scopes else None
+        
         # Create wrapper with authentication and error handling
         @wraps(func)
         async def wrapper(request, **kwargs):
             # Apply scope-based authorization if required
-            if required_scopes:
-                auth_dependency = require_scopes(*required_scopes)
+            if auth_dependency is not None:
                 auth_context = await auth_dependency(request)
                 kwargs['auth_context'] = auth_context
             
@@ -86,14 +88,10 @@ def register_deferred_tools():
     """Register tools that were decorated before MCP server was initialized"""
     if hasattr(mcp_tool, '_deferred_tools'):
         mcp_server = get_mcp_server()
-        for name, tool_func in mcp_tool._deferred_tools.items():
-            reg_info = tool_func._mcp_registration
-            mcp_server.register_tool(
-                name=reg_info['name'],
-                description=reg_info['description'],
-                input_schema=reg_info['input_schema'],
-                required_scopes=reg_info['required_scopes']
-            )(tool_func)
+        mcp_server.register_tools_bulk([
+            (tool_func, tool_func._mcp_registration)
+            for tool_func in mcp_tool._deferred_tools.values()
+        ])
         
         # Clear the deferred tools
         mcp_tool._deferred_tools.clear()
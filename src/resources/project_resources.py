@@ -1,9 +1,11 @@
 """
 MCP resources for project data access
 """
-import json
+import os
+import time
+import orjson
 import psutil
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from fastapi import Request
 
@@ -13,6 +15,171 @@ import structlog
 
 logger = structlog.get_logger()
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(payload: Any) -> str:
+    """Serialize a resource payload to indented JSON text"""
+    return orjson.dumps(payload, option=_JSON_OPTIONS).decode()
+
+
+# Tool and resource listings for the capabilities document, kept with the
+# registrations they were built from. A registration counts as changed when
+# its function or metadata changes, so re-registering a tool with a new
+# description rebuilds the listings.
+_capabilities_cache: Dict[str, Any] = {}
+
+
+def _registry_signature(mcp_server) -> Tuple[Any, ...]:
+    """Registered functions and their metadata, comparable across reads"""
+    return (
+        mcp_server,
+        [
+            (name, func, getattr(func, '_mcp_tool_info', None), getattr(func, '_required_scopes', None))
+            for name, func in mcp_server.tools.items()
+        ],
+        [
+            (uri, func, getattr(func, '_mcp_resource_info', None))
+            for uri, func in mcp_server.resources.items()
+        ]
+    )
+
+
+def _capabilities_json(mcp_server) -> Tuple[str, int, int]:
+    """Return the capabilities JSON text plus tool and resource counts"""
+    signature = _registry_signature(mcp_server)
+    if _capabilities_cache.get("signature") != signature:
+        tools_info = []
+        for name, tool_func in mcp_server.tools.items():
+            if hasattr(tool_func, '_mcp_tool_info'):
+                tool_info = tool_func._mcp_tool_info
+                required_scopes = getattr(tool_func, '_required_scopes', [])
+                
+                tools_info.append({
+                    "name": name,
+                    "description": tool_info.description,
+                    "required_scopes": required_scopes,
+                    "input_schema": tool_info.inputSchema
+                })
+        
+        resources_info = []
+        for uri, resource_func in mcp_server.resources.items():
+            if hasattr(resource_func, '_mcp_resource_info'):
+                resource_info = resource_func._mcp_resource_info
+                resources_info.append({
+                    "uri": uri,
+                    "name": resource_info.name,
+                    "description": resource_info.description,
+                    "mime_type": resource_info.mimeType
+                })
+        
+        # Only the current registry snapshot is worth keeping
+        _capabilities_cache.update(
+            signature=signature,
+            tools_info=tools_info,
+            resources_info=resources_info
+        )
+    
+    tools_info = _capabilities_cache["tools_info"]
+    resources_info = _capabilities_cache["resources_info"]
+    capabilities = {
+        "server_info": {
+            "name": mcp_server.server_info.name,
+            "version": mcp_server.server_info.version,
+            "protocol_version": "2024-11-05"
+        },
+        "capabilities": {
+            "tools": {
+                "count": len(tools_info),
+                "tools": tools_info
+            },
+            "resources": {
+                "count": len(resources_info),
+                "resources": resources_info
+            }
+        },
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    
+    return _dumps(capabilities), len(tools_info), len(resources_info)
+
+
+# File contents keyed on path, modification time and size, so repeated
+# reads skip the file read until it changes
+_file_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_FILE_CACHE_SIZE = 256
+
+
+async def _read_project_file(project_id: str, file_path: str) -> str:
+    """Return a project file's content, re-read only when it changes"""
+    file_manager = SecureFileManager()
+    # Validate the path before touching the filesystem, on cache hits too
+    target_file = file_manager.resolve_project_file(project_id, file_path)
+    try:
+        stat = os.stat(target_file)
+    except OSError:
+        # Missing file; let SecureFileManager report it
+        return await file_manager.read_project_file(project_id, file_path)
+    
+    # Size catches same-tick rewrites on filesystems with coarse timestamps
+    version = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(target_file)
+    cached = _file_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    content = await file_manager.read_project_file(project_id, file_path)
+    if len(_file_cache) >= _FILE_CACHE_SIZE:
+        _file_cache.clear()
+    _file_cache[cache_key] = (version, content)
+    return content
+
+
+# Latest psutil readings for system://metrics, refreshed by a read once
+# the snapshot is older than the sample interval
+METRICS_SAMPLE_INTERVAL = 5.0
+_metrics_snapshot: Dict[str, Any] = {}
+_metrics_sampled_at: Optional[float] = None
+
+
+def _sample_system_metrics() -> None:
+    """Take one psutil reading into the metrics snapshot"""
+    global _metrics_sampled_at
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    
+    # A non-blocking cpu_percent reports usage since the previous call and
+    # has nothing to compare against on the first one, so the first sample
+    # measures over a short interval instead
+    cpu_interval = 0.1 if _metrics_sampled_at is None else None
+    
+    _metrics_snapshot.update({
+        "cpu": {
+            "usage_percent": psutil.cpu_percent(interval=cpu_interval),
+            "count": psutil.cpu_count(),
+            "load_average": list(psutil.getloadavg()) if hasattr(psutil, 'getloadavg') else None
+        },
+        "memory": {
+            "total_gb": round(memory.total / (1024**3), 2),
+            "available_gb": round(memory.available / (1024**3), 2),
+            "usage_percent": memory.percent
+        },
+        "disk": {
+            "total_gb": round(disk.total / (1024**3), 2),
+            "free_gb": round(disk.free / (1024**3), 2),
+            "usage_percent": round((disk.used / disk.total) * 100, 1)
+        },
+        "network_stats": dict(psutil.net_io_counters()._asdict()) if hasattr(psutil, 'net_io_counters') else {}
+    })
+    _metrics_sampled_at = time.monotonic()
+
+
+def _current_system_metrics() -> Dict[str, Any]:
+    """Return the metrics snapshot, sampling first when it is missing or stale"""
+    if _metrics_sampled_at is None or time.monotonic() - _metrics_sampled_at >= METRICS_SAMPLE_INTERVAL:
+        _sample_system_metrics()
+    return dict(_metrics_snapshot)
+
 
 @mcp_resource(
     uri="project://*/structure",
@@ -44,7 +211,7 @@ async def project_structure_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": f"project://{project_id}/structure",
             "mimeType": "application/json",
-            "text": json.dumps(structure, indent=2)
+            "text": _dumps(structure)
         }
         
     except Exception as e:
@@ -57,11 +224,11 @@ async def project_structure_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": f"project://{project_id}/structure",
             "mimeType": "application/json",
-            "text": json.dumps({
+            "text": _dumps({
                 "error": str(e),
                 "project_id": project_id,
                 "timestamp": datetime.utcnow().isoformat()
-            }, indent=2)
+            })
         }
 
 
@@ -84,8 +251,7 @@ async def project_code_resource(request: Request) -> Dict[str, Any]:
     file_path = '/'.join(uri_parts[-2:])
     
     try:
-        file_manager = SecureFileManager()
-        file_content = await file_manager.read_project_file(project_id, file_path)
+        file_content = await _read_project_file(project_id, file_path)
         
         logger.info(
             "project_file_accessed",
@@ -138,7 +304,7 @@ async def project_structure_resource_simple(request: Request) -> Dict[str, Any]:
         return {
             "uri": "project://structure",
             "mimeType": "application/json",
-            "text": json.dumps(structure, indent=2)
+            "text": _dumps(structure)
         }
         
     except Exception as e:
@@ -151,11 +317,11 @@ async def project_structure_resource_simple(request: Request) -> Dict[str, Any]:
         return {
             "uri": "project://structure",
             "mimeType": "application/json",
-            "text": json.dumps({
+            "text": _dumps({
                 "error": str(e),
                 "project_id": "default",
                 "timestamp": datetime.utcnow().isoformat()
-            }, indent=2)
+            })
         }
 
 
@@ -170,8 +336,7 @@ async def project_main_file_resource(request: Request) -> Dict[str, Any]:
     Provide access to main project file
     """
     try:
-        file_manager = SecureFileManager()
-        file_content = await file_manager.read_project_file("default", "src/main.py")
+        file_content = await _read_project_file("default", "src/main.py")
         
         logger.info(
             "project_file_accessed",
@@ -212,10 +377,7 @@ async def system_metrics_resource(request: Request) -> Dict[str, Any]:
     Provide real-time system metrics
     """
     try:
-        # Collect system metrics
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        system = _current_system_metrics()
         
         project_manager = ProjectManager()
         active_projects = await project_manager.get_active_project_count()
@@ -223,41 +385,29 @@ async def system_metrics_resource(request: Request) -> Dict[str, Any]:
         metrics = {
             "timestamp": datetime.utcnow().isoformat(),
             "system_performance": {
-                "cpu": {
-                    "usage_percent": cpu_percent,
-                    "count": psutil.cpu_count(),
-                    "load_average": list(psutil.getloadavg()) if hasattr(psutil, 'getloadavg') else None
-                },
-                "memory": {
-                    "total_gb": round(memory.total / (1024**3), 2),
-                    "available_gb": round(memory.available / (1024**3), 2),
-                    "usage_percent": memory.percent
-                },
-                "disk": {
-                    "total_gb": round(disk.total / (1024**3), 2),
-                    "free_gb": round(disk.free / (1024**3), 2),
-                    "usage_percent": round((disk.used / disk.total) * 100, 1)
-                }
+                "cpu": system["cpu"],
+                "memory": system["memory"],
+                "disk": system["disk"]
             },
             "application_metrics": {
                 "active_projects": active_projects,
                 "generation_queue_size": 0,  # TODO: Implement queue monitoring
                 "server_status": "healthy"
             },
-            "network_stats": dict(psutil.net_io_counters()._asdict()) if hasattr(psutil, 'net_io_counters') else {}
+            "network_stats": system["network_stats"]
         }
         
         logger.debug(
             "system_metrics_accessed",
-            cpu_usage=cpu_percent,
-            memory_usage=memory.percent,
+            cpu_usage=system["cpu"]["usage_percent"],
+            memory_usage=system["memory"]["usage_percent"],
             active_projects=active_projects
         )
         
         return {
             "uri": "system://metrics",
             "mimeType": "application/json", 
-            "text": json.dumps(metrics, indent=2)
+            "text": _dumps(metrics)
         }
         
     except Exception as e:
@@ -266,10 +416,10 @@ async def system_metrics_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": "system://metrics",
             "mimeType": "application/json",
-            "text": json.dumps({
+            "text": _dumps({
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat()
-            }, indent=2)
+            })
         }
 
 
@@ -286,61 +436,18 @@ async def server_capabilities_resource(request: Request) -> Dict[str, Any]:
     try:
         from src.core.mcp_server import get_mcp_server
         
-        mcp_server = get_mcp_server()
-        
-        tools_info = []
-        for name, tool_func in mcp_server.tools.items():
-            if hasattr(tool_func, '_mcp_tool_info'):
-                tool_info = tool_func._mcp_tool_info
-                required_scopes = getattr(tool_func, '_required_scopes', [])
-                
-                tools_info.append({
-                    "name": name,
-                    "description": tool_info.description,
-                    "required_scopes": required_scopes,
-                    "input_schema": tool_info.inputSchema
-                })
-        
-        resources_info = []
-        for uri, resource_func in mcp_server.resources.items():
-            if hasattr(resource_func, '_mcp_resource_info'):
-                resource_info = resource_func._mcp_resource_info
-                resources_info.append({
-                    "uri": uri,
-                    "name": resource_info.name,
-                    "description": resource_info.description,
-                    "mime_type": resource_info.mimeType
-                })
-        
-        capabilities = {
-            "server_info": {
-                "name": mcp_server.server_info.name,
-                "version": mcp_server.server_info.version,
-                "protocol_version": "2024-11-05"
-            },
-            "capabilities": {
-                "tools": {
-                    "count": len(tools_info),
-                    "tools": tools_info
-                },
-                "resources": {
-                    "count": len(resources_info),
-                    "resources": resources_info
-                }
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        text, tools_count, resources_count = _capabilities_json(get_mcp_server())
         
         logger.info(
             "server_capabilities_accessed",
-            tools_count=len(tools_info),
-            resources_count=len(resources_info)
+            tools_count=tools_count,
+            resources_count=resources_count
         )
         
         return {
             "uri": "server://capabilities",
             "mimeType": "application/json",
-            "text": json.dumps(capabilities, indent=2)
+            "text": text
         }
         
     except Exception as e:
@@ -349,10 +456,10 @@ async def server_capabilities_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": "server://capabilities",
             "mimeType": "application/json",
-            "text": json.dumps({
+            "text": _dumps({
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat()
-            }, indent=2)
+            })
         }
 
 
@@ -369,61 +476,18 @@ async def mcp_capabilities_resource(request: Request) -> Dict[str, Any]:
     try:
         from src.core.mcp_server import get_mcp_server
         
-        mcp_server = get_mcp_server()
-        
-        tools_info = []
-        for name, tool_func in mcp_server.tools.items():
-            if hasattr(tool_func, '_mcp_tool_info'):
-                tool_info = tool_func._mcp_tool_info
-                required_scopes = getattr(tool_func, '_required_scopes', [])
-                
-                tools_info.append({
-                    "name": name,
-                    "description": tool_info.description,
-                    "required_scopes": required_scopes,
-                    "input_schema": tool_info.inputSchema
-                })
-        
-        resources_info = []
-        for uri, resource_func in mcp_server.resources.items():
-            if hasattr(resource_func, '_mcp_resource_info'):
-                resource_info = resource_func._mcp_resource_info
-                resources_info.append({
-                    "uri": uri,
-                    "name": resource_info.name,
-                    "description": resource_info.description,
-                    "mime_type": resource_info.mimeType
-                })
-        
-        capabilities = {
-            "server_info": {
-                "name": mcp_server.server_info.name,
-                "version": mcp_server.server_info.version,
-                "protocol_version": "2024-11-05"
-            },
-            "capabilities": {
-                "tools": {
-                    "count": len(tools_info),
-                    "tools": tools_info
-                },
-                "resources": {
-                    "count": len(resources_info),
-                    "resources": resources_info
-                }
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        text, tools_count, resources_count = _capabilities_json(get_mcp_server())
         
         logger.info(
             "mcp_capabilities_accessed",
-            tools_count=len(tools_info),
-            resources_count=len(resources_info)
+            tools_count=tools_count,
+            resources_count=resources_count
         )
         
         return {
             "uri": "mcp://capabilities",
             "mimeType": "application/json",
-            "text": json.dumps(capabilities, indent=2)
+            "text": text
         }
         
     except Exception as e:
@@ -432,10 +496,10 @@ async def mcp_capabilities_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": "mcp://capabilities",
             "mimeType": "application/json",
-            "text": json.dumps({
+            "text": _dumps({
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat()
-            }, indent=2)
+            })
         }
 
 
@@ -495,7 +559,7 @@ async def analytics_dashboard_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": "analytics://dashboard",
             "mimeType": "application/json",
-            "text": json.dumps(analytics_data, indent=2)
+            "text": _dumps(analytics_data)
         }
         
     except Exception as e:
@@ -504,8 +568,8 @@ async def analytics_dashboard_resource(request: Request) -> Dict[str, Any]:
         return {
             "uri": "analytics://dashboard",
             "mimeType": "application/json",
-            "text": json.dumps({
+            "text": _dumps({
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat()
-            }, indent=2)
+            })
         }
\ No newline at end of file
@@ -26,13 +26,114 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.config import Settings
 
+# Run async tests on uvloop when it is available; it is optional and
+# unsupported on Windows, so fall back to the default loop otherwise.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def pytest_addoption(parser):
+    """Let CI A/B the event loop with --uvloop=auto|on|off"""
+    parser.addoption(
+        "--uvloop",
+        choices=("auto", "on", "off"),
+        default="auto",
+        help="Event loop for async tests: uvloop when installed (auto), required (on) or never (off)"
+    )
+
+
+def pytest_configure(config):
+    """Reject --uvloop=on when uvloop is not installed"""
+    if config.getoption("--uvloop") == "on" and uvloop is None:
+        raise pytest.UsageError("--uvloop=on requires uvloop to be installed")
+
+
+if uvloop is not None:
+    @pytest.fixture(scope="session")
+    def event_loop_policy(request):
+        """Event loop policy for the session's async tests, selected by --uvloop
+        
+        pytest-asyncio installs it only while its loops are running and
+        restores the previous policy afterwards.
+        """
+        if request.config.getoption("--uvloop") == "off":
+            return asyncio.DefaultEventLoopPolicy()
+        return uvloop.EventLoopPolicy()
+
+# Scopes the app's tools require, granted to every request in the session app
+TEST_TOOL_SCOPES = [
+    "tools:ping", "tools:generate", "tools:deploy",
+    "tools:review", "tools:fix", "admin:metrics"
+]
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def initialized_services():
+    """Build an MCP server with the app's tools and resources once per session"""
+    import time
+    from fastapi import FastAPI
+    from src.core.descope_auth import AuthContext
+    from src.core.mcp_server import initialize_mcp_server
+    from src.core.tool_registry import register_deferred_tools, register_deferred_resources
+    
+    app = FastAPI()
+    
+    @app.middleware("http")
+    async def test_auth(request, call_next):
+        # Stand in for DescopeAuthMiddleware with a token holding every tool scope
+        request.state.auth_context = AuthContext({
+            "sub": "test_user",
+            "permissions": TEST_TOOL_SCOPES,
+            "aud": "test_client",
+            "iat": int(time.time()),
+            "exp": int(time.time()) + 3600,
+            "jti": "test-correlation-id"
+        })
+        request.state.correlation_id = "test-correlation-id"
+        return await call_next(request)
+    
+    server = initialize_mcp_server(app)
+    # Tool and resource modules register themselves on import; any imported
+    # before a server existed are picked up from the deferred registrations
+    import src.tools.infrastructure_tools, src.tools.generation_tools, src.tools.quality_tools  # noqa: F401
+    import src.resources.project_resources  # noqa: F401
+    register_deferred_tools()
+    register_deferred_resources()
+    return server
+
+
+@pytest.fixture(scope="session")
+async def client(initialized_services):
+    """Async client for the session MCP server's app, shared by the whole session"""
+    import httpx
+    
+    transport = httpx.ASGITransport(app=initialized_services.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def restore_mcp_registries(request):
+    """Drop tools/resources a test registers on a shared MCP server
+    
+    Covers the session server and module-level ``mcp_server`` fixtures, and
+    drops caches derived from the registries once they are restored.
+    """
+    names = [name for name in ("initialized_services", "mcp_server") if name in request.fixturenames]
+    if not names:
+        yield
+        return
+    
+    server = request.getfixturevalue(names[0])
+    tools, resources = dict(server.tools), dict(server.resources)
+    yield
+    server.tools.clear()
+    server.tools.update(tools)
+    server.resources.clear()
+    server.resources.update(resources)
+    server.invalidate_caches()
 
 
 @pytest.fixture
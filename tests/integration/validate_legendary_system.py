@@ -3,167 +3,159 @@
 Simple validation script for legendary upgrades integration
 """
 
+import importlib
+import re
 import sys
 import os
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Substrings that mark a tool name as one of the legendary tools
+LEGENDARY_TOOL_KEYWORDS = ('legendary', 'autonomous', 'proactive', 'evolutionary', 'last_mile')
+LEGENDARY_TOOL_PATTERN = re.compile('|'.join(LEGENDARY_TOOL_KEYWORDS))
+
+# Candidate registry attributes on the FastMCP server, most preferred first
+TOOL_ATTRS = ('tools', '_tools', '_tool_handlers')
+RESOURCE_ATTRS = ('resources', '_resources')
+PROMPT_ATTRS = ('prompts', '_prompts')
+
+# Attribute resolved for each (server type, candidates) pair
+_FASTMCP_ATTRS = {}
+
+def _first_attr(obj, names):
+    """Return the first of names present on obj, probing once per type"""
+    key = (type(obj), names)
+    if key not in _FASTMCP_ATTRS:
+        _FASTMCP_ATTRS[key] = next((name for name in names if hasattr(obj, name)), None)
+    name = _FASTMCP_ATTRS[key]
+    return getattr(obj, name, None) if name else None
+
 def test_legendary_imports():
     """Test that all legendary components can be imported"""
-    
-    print("🚀 Testing Legendary MCP Server Import Validation")
-    print("=" * 60)
+    out = []
+    try:
+        return _check_legendary_imports(out)
+    finally:
+        # One write for the whole report; QUIET=1 leaves only the result
+        if not os.environ.get('QUIET'):
+            sys.stdout.write('\n'.join(out) + '\n')
+
+def _check_legendary_imports(out):
+    """Run the import checks, appending report lines to out"""
+    out.append("🚀 Testing Legendary MCP Server Import Validation")
+    out.append("=" * 60)
     
     # Test 1: Core MCP Server
-    print("\n📋 Testing MCP Server import...")
+    out.append("\n📋 Testing MCP Server import...")
     try:
         from mcp_server import mcp
-        print("✅ MCP Server imported successfully")
-        print(f"   - Server name: {mcp.name}")
+        out.append("✅ MCP Server imported successfully")
+        out.append(f"   - Server name: {mcp.name}")
     except Exception as e:
-        print(f"❌ MCP Server import failed: {e}")
+        out.append(f"❌ MCP Server import failed: {e}")
         return False
     
     # Test 2: Orchestrator with legendary agents
-    print("\n🎭 Testing Orchestrator with legendary agents...")
+    out.append("\n🎭 Testing Orchestrator with legendary agents...")
     try:
         from src.agents.orchestrator import AgentOrchestrator
         orchestrator = AgentOrchestrator()
-        print("✅ Orchestrator imported and instantiated successfully")
-        print(f"   - Standard agents configured: {len(orchestrator.agents)}")
-        print(f"   - Legendary agents configured: {len(orchestrator.legendary_agents)}")
-        print(f"   - Has architect agent: {orchestrator.architect_agent is not None}")
-        print(f"   - Has quality agent: {orchestrator.quality_agent is not None}")
-        print(f"   - Has prompt engine: {orchestrator.prompt_engine is not None}")
-        print(f"   - Has cloud agent: {orchestrator.cloud_agent is not None}")
+        out.append("✅ Orchestrator imported and instantiated successfully")
+        out.append(f"   - Standard agents configured: {len(orchestrator.agents)}")
+        out.append(f"   - Legendary agents configured: {len(orchestrator.legendary_agents)}")
+        out.append(f"   - Has architect agent: {orchestrator.architect_agent is not None}")
+        out.append(f"   - Has quality agent: {orchestrator.quality_agent is not None}")
+        out.append(f"   - Has prompt engine: {orchestrator.prompt_engine is not None}")
+        out.append(f"   - Has cloud agent: {orchestrator.cloud_agent is not None}")
     except Exception as e:
-        print(f"❌ Orchestrator import failed: {e}")
+        out.append(f"❌ Orchestrator import failed: {e}")
         return False
     
     # Test 3: Individual Legendary Agents
-    print("\n🤖 Testing individual legendary agents...")
-    
-    # Architect Agent
-    try:
-        from src.agents.architect_agent import ArchitectAgent
-        print("✅ Architect Agent imported successfully")
-    except Exception as e:
-        print(f"❌ Architect Agent import failed: {e}")
+    out.append("\n🤖 Testing individual legendary agents...")
     
-    # Proactive Quality Agent
-    try:
-        from src.agents.proactive_quality_agent import ProactiveQualityAgent
-        print("✅ Proactive Quality Agent imported successfully")
-    except Exception as e:
-        print(f"❌ Proactive Quality Agent import failed: {e}")
-    
-    # Evolutionary Prompt Engine
-    try:
-        from src.agents.evolutionary_prompt_engine import EvolutionaryPromptEngine
-        print("✅ Evolutionary Prompt Engine imported successfully")
-    except Exception as e:
-        print(f"❌ Evolutionary Prompt Engine import failed: {e}")
-    
-    # Last Mile Cloud Agent
-    try:
-        from src.agents.last_mile_cloud_agent import LastMileCloudAgent
-        print("✅ Last Mile Cloud Agent imported successfully")
-    except Exception as e:
-        print(f"❌ Last Mile Cloud Agent import failed: {e}")
+    legendary_agents = [
+        ("Architect Agent", "src.agents.architect_agent", "ArchitectAgent"),
+        ("Proactive Quality Agent", "src.agents.proactive_quality_agent", "ProactiveQualityAgent"),
+        ("Evolutionary Prompt Engine", "src.agents.evolutionary_prompt_engine", "EvolutionaryPromptEngine"),
+        ("Last Mile Cloud Agent", "src.agents.last_mile_cloud_agent", "LastMileCloudAgent"),
+    ]
+    for label, module_name, class_name in legendary_agents:
+        try:
+            getattr(importlib.import_module(module_name), class_name)
+            out.append(f"✅ {label} imported successfully")
+        except Exception as e:
+            out.append(f"❌ {label} import failed: {e}")
     
     # Test 4: Check tool registration
-    print("\n🛠️ Testing tool registration...")
+    out.append("\n🛠️ Testing tool registration...")
     try:
-        # Try different ways to access tools
-        tools = []
+        # Registered tools live under different attributes across FastMCP versions
+        tools = list((_first_attr(mcp, TOOL_ATTRS) or {}).keys())
         
-        # Method 1: Direct attribute access
-        if hasattr(mcp, 'tools'):
-            tools = list(mcp.tools.keys())
-        # Method 2: Private attribute
-        elif hasattr(mcp, '_tools'):
-            tools = list(mcp._tools.keys())
-        # Method 3: Check handlers
-        elif hasattr(mcp, '_tool_handlers'):
-            tools = list(mcp._tool_handlers.keys())
-        # Method 4: Check app and look for registered routes/tools
-        else:
-            print("   Checking alternative tool discovery methods...")
-            # Try to inspect the mcp object
-            attrs = [attr for attr in dir(mcp) if 'tool' in attr.lower()]
-            print(f"   Available tool-related attributes: {attrs}")
-        
-        print(f"✅ {len(tools)} tools registered successfully")
+        out.append(f"✅ {len(tools)} tools registered successfully")
         
         if tools:
-            print("   Standard tools:")
-            standard_tools = [t for t in tools if not any(keyword in t for keyword in ['legendary', 'autonomous', 'proactive', 'evolutionary', 'last_mile'])]
+            # Classify every tool in a single pass
+            standard_tools, legendary_tools = [], []
+            for tool in tools:
+                (legendary_tools if LEGENDARY_TOOL_PATTERN.search(tool) else standard_tools).append(tool)
+            
+            out.append("   Standard tools:")
             for tool in standard_tools:
-                print(f"     - {tool}")
+                out.append(f"     - {tool}")
             
-            print("   Legendary tools:")
-            legendary_tools = [t for t in tools if any(keyword in t for keyword in ['legendary', 'autonomous', 'proactive', 'evolutionary', 'last_mile'])]
+            out.append("   Legendary tools:")
             for tool in legendary_tools:
-                print(f"     - {tool}")
+                out.append(f"     - {tool}")
             
             if len(legendary_tools) >= 5:
-                print(f"✅ All {len(legendary_tools)} legendary tools registered!")
+                out.append(f"✅ All {len(legendary_tools)} legendary tools registered!")
             else:
-                print(f"⚠️  Only {len(legendary_tools)} legendary tools found (expected 5+)")
+                out.append(f"⚠️  Only {len(legendary_tools)} legendary tools found (expected 5+)")
         else:
-            print("⚠️  No tools detected - may be registered at runtime")
+            out.append("⚠️  No tools detected - may be registered at runtime")
             
     except Exception as e:
-        print(f"❌ Tool registration check failed: {e}")
+        out.append(f"❌ Tool registration check failed: {e}")
     
     # Test 5: Check resources and prompts
-    print("\n📚 Testing resources and prompts...")
+    out.append("\n📚 Testing resources and prompts...")
     try:
-        resources = []
-        prompts = []
-        
-        # Try different ways to access resources and prompts
-        if hasattr(mcp, 'resources'):
-            resources = list(mcp.resources.keys())
-        elif hasattr(mcp, '_resources'):
-            resources = list(mcp._resources.keys())
-            
-        if hasattr(mcp, 'prompts'):
-            prompts = list(mcp.prompts.keys())
-        elif hasattr(mcp, '_prompts'):
-            prompts = list(mcp._prompts.keys())
+        resources = list((_first_attr(mcp, RESOURCE_ATTRS) or {}).keys())
+        prompts = list((_first_attr(mcp, PROMPT_ATTRS) or {}).keys())
         
-        print(f"✅ {len(resources)} resources registered: {resources}")
-        print(f"✅ {len(prompts)} prompts registered: {prompts}")
+        out.append(f"✅ {len(resources)} resources registered: {resources}")
+        out.append(f"✅ {len(prompts)} prompts registered: {prompts}")
         
         # Check for revolutionary prompt
         if 'revolutionary-development' in prompts:
-            print("✅ Revolutionary development prompt found!")
+            out.append("✅ Revolutionary development prompt found!")
         else:
-            print("⚠️  Revolutionary development prompt not found")
+            out.append("⚠️  Revolutionary development prompt not found")
             
     except Exception as e:
-        print(f"❌ Resources/prompts check failed: {e}")
+        out.append(f"❌ Resources/prompts check failed: {e}")
     
     # Test 6: Runtime tool validation
-    print("\n🔧 Testing runtime tool validation...")
+    out.append("\n🔧 Testing runtime tool validation...")
     try:
         # Create a test HTTP app to see what's registered
         app = mcp.http_app()
-        print("✅ HTTP app created successfully")
-        print("   Tools are likely registered at runtime during MCP protocol initialization")
+        out.append("✅ HTTP app created successfully")
+        out.append("   Tools are likely registered at runtime during MCP protocol initialization")
         
     except Exception as e:
-        print(f"❌ HTTP app creation failed: {e}")
+        out.append(f"❌ HTTP app creation failed: {e}")
     
-    print("\n🎯 Legendary Import Validation Complete!")
-    print("=" * 60)
-    print("🚀 System is ready for revolutionary deployment!")
-    print("\n💡 Next steps:")
-    print("   1. Deploy to Smithery: git push (auto-deploy)")
-    print("   2. Test legendary tools in MCP client")
-    print("   3. Finalize competition submission")
+    out.append("\n🎯 Legendary Import Validation Complete!")
+    out.append("=" * 60)
+    out.append("🚀 System is ready for revolutionary deployment!")
+    out.append("\n💡 Next steps:")
+    out.append("   1. Deploy to Smithery: git push (auto-deploy)")
+    out.append("   2. Test legendary tools in MCP client")
+    out.append("   3. Finalize competition submission")
     
     return True
 
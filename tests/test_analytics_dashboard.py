@@ -8,6 +8,7 @@ import random
 import time
 from datetime import datetime, timezone
 import json
+import pytest
 
 # Import our analytics dashboard
 import sys
@@ -88,6 +89,8 @@ async def simulate_realistic_workload():
     
     print("✅ Workload simulation completed!")
 
+@pytest.mark.slow
+@pytest.mark.timeout(15)
 async def test_analytics_dashboard():
     """Test the complete analytics dashboard functionality"""
     
@@ -1,441 +1,466 @@
 """
 Test suite for healing system MCP tools
 """
-import unittest
-import uuid
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
-from src.healing.healing_tools import (
-    start_health_monitoring,
-    stop_health_monitoring,
-    get_health_status,
-    perform_health_check,
-    start_healing_loop,
-    stop_healing_loop,
-    trigger_healing_session,
-    get_healing_status,
-    get_healing_session_details
-)
-from src.agents.orchestrator_mcp_tools import (
-    generate_application_with_healing,
-    enable_project_healing,
-    disable_project_healing,
-    get_orchestrator_health_status,
-    trigger_orchestrator_healing,
-    get_orchestrator_status,
-    configure_healing_settings
-)
+# The tool modules are imported lazily (see the fixtures below), but their third-party
+# stack is checked up front so a missing dependency skips the module once instead of
+# erroring every test.
+pytest.importorskip("structlog")
+pytest.importorskip("fastapi")
 
+# Tests only compare the returned session id with the injected one
+TEST_SESSION_ID = "00000000-0000-0000-0000-000000000001"
 
-class TestHealingMCPTools(unittest.TestCase):
-    """Test cases for healing system MCP tools"""
+ORCHESTRATOR_PROJECT_ID = "orchestrator_mcp_test"
+
+# Canned collaborator results; the tools copy these into new dicts and never mutate them
+HEALING_STATUS_ACTIVE = {
+    "status": "active",
+    "active_sessions": 2,
+    "completed_sessions": 5,
+    "learning_data": {"total_sessions": 7}
+}
+
+GENERATED_APP_RESULT = {
+    "project_id": ORCHESTRATOR_PROJECT_ID,
+    "status": "completed",
+    "generation_summary": "Test application generated"
+}
+
+HEALING_ENABLED_RESULT = {
+    "success": True,
+    "project_id": ORCHESTRATOR_PROJECT_ID,
+    "healing_enabled": True,
+    "monitoring_active": True
+}
+
+HEALING_DISABLED_RESULT = {
+    "success": True,
+    "project_id": ORCHESTRATOR_PROJECT_ID,
+    "healing_enabled": False
+}
+
+ORCHESTRATOR_HEALTH_STATUS = {
+    "project_id": ORCHESTRATOR_PROJECT_ID,
+    "healing_enabled": True,
+    "failure_count": 1,
+    "health_status": "good",
+    "health_score": 0.8
+}
+
+
+class _HealthMonitorSpec:
+    """Surface of HealthMonitor used by the healing MCP tools"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_project_id = "mcp_test_project"
-        self.mock_request = Mock()
-        self.mock_auth_context = Mock()
+    async def start_continuous_monitoring(self, project_id, interval_seconds=60): ...
     
-    @pytest.mark.asyncio
-    async def test_start_health_monitoring_tool(self):
-        """Test start_health_monitoring MCP tool"""
-        with patch('src.healing.healing_tools.get_health_monitor') as mock_monitor:
-            mock_monitor.return_value.start_continuous_monitoring.return_value = Mock()
-            
-            result = await start_health_monitoring(
-                project_id=self.test_project_id,
-                interval_seconds=60,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
-            )
-            
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertTrue(result["monitoring_started"])
-            self.assertIn("correlation_id", result)
+    async def perform_comprehensive_health_check(self, project_id): ...
+
+
+class _HealingLoopSpec:
+    """Surface of HealingLoop used by the healing MCP tools"""
+    
+    status = None
+    
+    async def start_healing_loop(self, project_id): ...
+    
+    async def trigger_healing_session(self, project_id, trigger_issue): ...
+    
+    def get_healing_status(self): ...
+
+
+def _spec_stub(spec, **config):
+    """Build a spec_set mock configured in one call (async methods become AsyncMock)"""
+    return Mock(spec_set=spec, **config)
+
+
+@pytest.fixture(scope="session")
+def healing_tools():
+    """Healing MCP tools module, imported on first use"""
+    from src.healing import healing_tools
+    return healing_tools
+
+
+@pytest.fixture(scope="session")
+def orchestrator_tools():
+    """Orchestrator MCP tools module, imported on first use"""
+    from src.agents import orchestrator_mcp_tools
+    return orchestrator_mcp_tools
+
+
+@pytest.fixture
+def mock_request():
+    """Mock incoming request"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_auth_context():
+    """Mock authentication context"""
+    return Mock()
+
+
+@pytest.mark.fast
+class TestHealingMCPTools:
+    """Test cases for healing system MCP tools"""
+    
+    @pytest.fixture
+    def test_project_id(self):
+        """Project id used by the healing tools"""
+        return "mcp_test_project"
     
     @pytest.mark.asyncio
-    async def test_start_health_monitoring_tool_error(self):
-        """Test start_health_monitoring MCP tool error handling"""
-        with patch('src.healing.healing_tools.get_health_monitor') as mock_monitor:
-            mock_monitor.return_value.start_continuous_monitoring.side_effect = Exception("Test error")
-            
-            result = await start_health_monitoring(
-                project_id=self.test_project_id,
+    @pytest.mark.parametrize("side_effect,expected_success", [
+        (None, True),
+        (Exception("Test error"), False),
+    ])
+    async def test_start_health_monitoring_tool(
+        self, healing_tools, test_project_id, mock_request, mock_auth_context, side_effect, expected_success
+    ):
+        """Test start_health_monitoring MCP tool success and error handling"""
+        # The monitoring task handle is discarded by the tool, so no return value is needed
+        monitor = _spec_stub(_HealthMonitorSpec, **{
+            "start_continuous_monitoring.return_value": None,
+            "start_continuous_monitoring.side_effect": side_effect
+        })
+        with patch('src.healing.healing_tools.get_health_monitor', return_value=monitor):
+            result = await healing_tools.start_health_monitoring(
+                project_id=test_project_id,
                 interval_seconds=60,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertFalse(result["success"])
-            self.assertIn("error", result)
-            self.assertIn("correlation_id", result)
+            assert result["success"] is expected_success
+            assert "correlation_id" in result
+            if expected_success:
+                assert {"project_id": test_project_id, "monitoring_started": True}.items() <= result.items()
+            else:
+                assert "error" in result
     
     @pytest.mark.asyncio
-    async def test_perform_health_check_tool(self):
+    async def test_perform_health_check_tool(self, healing_tools, test_project_id, mock_request, mock_auth_context):
         """Test perform_health_check MCP tool"""
-        with patch('src.healing.healing_tools.get_health_monitor') as mock_monitor:
-            # Mock health report
-            mock_report = Mock()
-            mock_report.overall_status.value = "good"
-            mock_report.health_score = 0.85
-            mock_report.issues = []
-            mock_report.recommendations = ["Keep up the good work"]
-            mock_report.timestamp.isoformat.return_value = "2024-01-01T00:00:00"
-            
-            mock_monitor.return_value.perform_comprehensive_health_check.return_value = mock_report
-            
-            result = await perform_health_check(
-                project_id=self.test_project_id,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+        # Plain health report stub; no Mock attribute chains to keep alive
+        mock_report = SimpleNamespace(
+            overall_status=SimpleNamespace(value="good"),
+            health_score=0.85,
+            issues=[],
+            recommendations=["Keep up the good work"],
+            timestamp=datetime(2024, 1, 1)
+        )
+        monitor = _spec_stub(_HealthMonitorSpec, **{"perform_comprehensive_health_check.return_value": mock_report})
+        
+        with patch('src.healing.healing_tools.get_health_monitor', return_value=monitor):
+            result = await healing_tools.perform_health_check(
+                project_id=test_project_id,
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertEqual(result["health_status"], "good")
-            self.assertEqual(result["health_score"], 0.85)
-            self.assertEqual(result["issues_count"], 0)
+            assert {
+                "success": True,
+                "project_id": test_project_id,
+                "health_status": "good",
+                "health_score": 0.85,
+                "issues_count": 0
+            }.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_start_healing_loop_tool(self):
+    async def test_start_healing_loop_tool(self, healing_tools, test_project_id, mock_request, mock_auth_context):
         """Test start_healing_loop MCP tool"""
-        with patch('src.healing.healing_tools.get_healing_loop') as mock_loop:
-            mock_loop.return_value.start_healing_loop.return_value = Mock()
-            mock_loop.return_value.status.value = "active"
-            
-            result = await start_healing_loop(
-                project_id=self.test_project_id,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+        healing_loop = _spec_stub(_HealingLoopSpec, **{
+            "start_healing_loop.return_value": None,
+            "status": SimpleNamespace(value="active")
+        })
+        with patch('src.healing.healing_tools.get_healing_loop', return_value=healing_loop):
+            result = await healing_tools.start_healing_loop(
+                project_id=test_project_id,
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertTrue(result["healing_loop_started"])
-            self.assertEqual(result["status"], "active")
+            assert {
+                "success": True,
+                "project_id": test_project_id,
+                "healing_loop_started": True,
+                "status": "active"
+            }.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_trigger_healing_session_tool(self):
-        """Test trigger_healing_session MCP tool"""
-        with patch('src.healing.healing_tools.get_healing_loop') as mock_loop:
-            mock_session_id = str(uuid.uuid4())
-            mock_loop.return_value.trigger_healing_session.return_value = mock_session_id
-            
-            result = await trigger_healing_session(
-                project_id=self.test_project_id,
+    @pytest.mark.parametrize("session_limit_reached", [False, True])
+    async def test_trigger_healing_session_tool(
+        self, healing_tools, test_project_id, mock_request, mock_auth_context, session_limit_reached
+    ):
+        """Test trigger_healing_session MCP tool, including when the session limit is reached"""
+        mock_session_id = None if session_limit_reached else TEST_SESSION_ID
+        healing_loop = _spec_stub(_HealingLoopSpec, **{"trigger_healing_session.return_value": mock_session_id})
+        
+        with patch('src.healing.healing_tools.get_healing_loop', return_value=healing_loop):
+            result = await healing_tools.trigger_healing_session(
+                project_id=test_project_id,
                 issue_description="Test issue description",
                 issue_severity=7,
                 error_message="Test error message",
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertEqual(result["session_id"], mock_session_id)
-            self.assertTrue(result["healing_session_triggered"])
+            assert result["project_id"] == test_project_id
+            if session_limit_reached:
+                assert not result["success"]
+                assert "Failed to trigger healing session" in result["error"]
+            else:
+                assert {
+                    "success": True,
+                    "session_id": mock_session_id,
+                    "healing_session_triggered": True
+                }.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_trigger_healing_session_tool_failure(self):
-        """Test trigger_healing_session MCP tool when session limit reached"""
-        with patch('src.healing.healing_tools.get_healing_loop') as mock_loop:
-            mock_loop.return_value.trigger_healing_session.return_value = None  # Session limit reached
-            
-            result = await trigger_healing_session(
-                project_id=self.test_project_id,
-                issue_description="Test issue description",
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
-            )
-            
-            self.assertFalse(result["success"])
-            self.assertIn("Failed to trigger healing session", result["error"])
-    
-    @pytest.mark.asyncio
-    async def test_get_healing_status_tool(self):
+    async def test_get_healing_status_tool(self, healing_tools, mock_request, mock_auth_context):
         """Test get_healing_status MCP tool"""
-        with patch('src.healing.healing_tools.get_healing_loop') as mock_loop:
-            mock_status = {
-                "status": "active",
-                "active_sessions": 2,
-                "completed_sessions": 5,
-                "learning_data": {"total_sessions": 7}
-            }
-            mock_loop.return_value.get_healing_status.return_value = mock_status
-            
-            result = await get_healing_status(
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+        healing_loop = _spec_stub(_HealingLoopSpec, **{"get_healing_status.return_value": HEALING_STATUS_ACTIVE})
+        
+        with patch('src.healing.healing_tools.get_healing_loop', return_value=healing_loop):
+            result = await healing_tools.get_healing_status(
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["status"], "active")
-            self.assertEqual(result["active_sessions"], 2)
-            self.assertEqual(result["completed_sessions"], 5)
+            assert {"success": True, **HEALING_STATUS_ACTIVE}.items() <= result.items()
 
 
-class TestOrchestratorMCPTools(unittest.TestCase):
+@pytest.mark.fast
+class TestOrchestratorMCPTools:
     """Test cases for orchestrator MCP tools with healing integration"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_project_id = "orchestrator_mcp_test"
-        self.mock_request = Mock()
-        self.mock_auth_context = Mock()
+    @pytest.fixture
+    def test_project_id(self):
+        """Project id used by the orchestrator tools"""
+        return ORCHESTRATOR_PROJECT_ID
     
     @pytest.mark.asyncio
-    async def test_generate_application_with_healing_tool(self):
+    async def test_generate_application_with_healing_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test generate_application_with_healing MCP tool"""
         with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_result = {
-                "project_id": self.test_project_id,
-                "status": "completed",
-                "generation_summary": "Test application generated"
-            }
-            mock_orchestrator.return_value.generate_complete_application.return_value = mock_result
+            mock_orchestrator.return_value.generate_complete_application = AsyncMock(
+                return_value=GENERATED_APP_RESULT
+            )
             
-            result = await generate_application_with_healing(
+            result = await orchestrator_tools.generate_application_with_healing(
                 description="Test application description",
                 project_type="fullstack",
                 technology_stack="React + FastAPI",
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertTrue(result["healing_enabled"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertIn("correlation_id", result)
+            assert {"success": True, "healing_enabled": True, **GENERATED_APP_RESULT}.items() <= result.items()
+            assert "correlation_id" in result
     
     @pytest.mark.asyncio
-    async def test_enable_project_healing_tool(self):
+    async def test_enable_project_healing_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test enable_project_healing MCP tool"""
         with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_result = {
-                "success": True,
-                "project_id": self.test_project_id,
-                "healing_enabled": True,
-                "monitoring_active": True
-            }
-            mock_orchestrator.return_value.enable_healing_for_project.return_value = mock_result
+            mock_orchestrator.return_value.enable_healing_for_project = AsyncMock(
+                return_value=HEALING_ENABLED_RESULT
+            )
             
-            result = await enable_project_healing(
-                project_id=self.test_project_id,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+            result = await orchestrator_tools.enable_project_healing(
+                project_id=test_project_id,
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertTrue(result["healing_enabled"])
-            self.assertTrue(result["monitoring_active"])
+            assert HEALING_ENABLED_RESULT.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_disable_project_healing_tool(self):
+    async def test_disable_project_healing_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test disable_project_healing MCP tool"""
         with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_result = {
-                "success": True,
-                "project_id": self.test_project_id,
-                "healing_enabled": False
-            }
-            mock_orchestrator.return_value.disable_healing_for_project.return_value = mock_result
+            mock_orchestrator.return_value.disable_healing_for_project = AsyncMock(
+                return_value=HEALING_DISABLED_RESULT
+            )
             
-            result = await disable_project_healing(
-                project_id=self.test_project_id,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+            result = await orchestrator_tools.disable_project_healing(
+                project_id=test_project_id,
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertFalse(result["healing_enabled"])
+            assert HEALING_DISABLED_RESULT.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_get_orchestrator_health_status_tool(self):
+    async def test_get_orchestrator_health_status_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test get_orchestrator_health_status MCP tool"""
         with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_status = {
-                "project_id": self.test_project_id,
-                "healing_enabled": True,
-                "failure_count": 1,
-                "health_status": "good",
-                "health_score": 0.8
-            }
-            mock_orchestrator.return_value.get_project_health_status.return_value = mock_status
+            mock_orchestrator.return_value.get_project_health_status = AsyncMock(
+                return_value=ORCHESTRATOR_HEALTH_STATUS
+            )
             
-            result = await get_orchestrator_health_status(
-                project_id=self.test_project_id,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+            result = await orchestrator_tools.get_orchestrator_health_status(
+                project_id=test_project_id,
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertTrue(result["healing_enabled"])
-            self.assertEqual(result["health_status"], "good")
+            assert {"success": True, **ORCHESTRATOR_HEALTH_STATUS}.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_trigger_orchestrator_healing_tool(self):
+    async def test_trigger_orchestrator_healing_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test trigger_orchestrator_healing MCP tool"""
         with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_orchestrator.return_value.trigger_healing_on_failure.return_value = True
+            mock_orchestrator.return_value.trigger_healing_on_failure = AsyncMock(return_value=True)
             
-            result = await trigger_orchestrator_healing(
-                project_id=self.test_project_id,
+            result = await orchestrator_tools.trigger_orchestrator_healing(
+                project_id=test_project_id,
                 issue_description="Test orchestration issue",
                 task_context={"task_type": "test_task"},
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertEqual(result["project_id"], self.test_project_id)
-            self.assertTrue(result["healing_triggered"])
+            assert {
+                "success": True,
+                "project_id": test_project_id,
+                "healing_triggered": True
+            }.items() <= result.items()
     
     @pytest.mark.asyncio
-    async def test_get_orchestrator_status_tool(self):
+    async def test_get_orchestrator_status_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test get_orchestrator_status MCP tool"""
-        with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_orchestrator_obj = Mock()
-            mock_orchestrator_obj.active_sessions = {}
-            mock_orchestrator_obj.tasks = {}
-            mock_orchestrator_obj.healing_enabled = True
-            mock_orchestrator_obj.auto_healing_threshold = 2
-            mock_orchestrator_obj.project_health_status = {}
-            mock_orchestrator_obj.get_project_health_status.return_value = {}
-            
-            mock_orchestrator.return_value = mock_orchestrator_obj
-            
-            result = await get_orchestrator_status(
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+        mock_orchestrator_obj = SimpleNamespace(
+            active_sessions={},
+            tasks={},
+            healing_enabled=True,
+            auto_healing_threshold=2,
+            project_health_status={},
+            get_project_health_status=AsyncMock(return_value={})
+        )
+        
+        with patch('src.agents.orchestrator_mcp_tools.get_orchestrator', return_value=mock_orchestrator_obj):
+            result = await orchestrator_tools.get_orchestrator_status(
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertIn("orchestrator_status", result)
-            self.assertTrue(result["orchestrator_status"]["healing_enabled"])
-            self.assertEqual(result["orchestrator_status"]["healing_threshold"], 2)
+            assert result["success"]
+            assert {"healing_enabled": True, "healing_threshold": 2}.items() <= result["orchestrator_status"].items()
     
     @pytest.mark.asyncio
-    async def test_configure_healing_settings_tool(self):
+    async def test_configure_healing_settings_tool(
+        self, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test configure_healing_settings MCP tool"""
-        with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_orchestrator_obj = Mock()
-            mock_orchestrator_obj.auto_healing_threshold = 2
-            mock_orchestrator_obj.healing_enabled = True
-            
-            mock_orchestrator.return_value = mock_orchestrator_obj
-            
-            result = await configure_healing_settings(
+        mock_orchestrator_obj = SimpleNamespace(auto_healing_threshold=2, healing_enabled=True)
+        
+        with patch('src.agents.orchestrator_mcp_tools.get_orchestrator', return_value=mock_orchestrator_obj):
+            result = await orchestrator_tools.configure_healing_settings(
                 auto_healing_threshold=3,
                 healing_enabled=False,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+                request=mock_request,
+                auth_context=mock_auth_context
             )
             
-            self.assertTrue(result["success"])
-            self.assertIn("changes", result)
-            self.assertIn("current_settings", result)
+            assert result["success"]
+            assert "changes" in result
+            assert "current_settings" in result
             
             # Check that settings were updated
-            self.assertEqual(mock_orchestrator_obj.auto_healing_threshold, 3)
-            self.assertFalse(mock_orchestrator_obj.healing_enabled)
+            assert mock_orchestrator_obj.auto_healing_threshold == 3
+            assert not mock_orchestrator_obj.healing_enabled
 
 
-class TestMCPToolsIntegration(unittest.TestCase):
+@pytest.mark.integration
+@pytest.mark.timeout(15)
+class TestMCPToolsIntegration:
     """Integration tests for MCP tools working together"""
     
-    def setUp(self):
-        """Set up integration test fixtures"""
-        self.test_project_id = "mcp_integration_test"
-        self.mock_request = Mock()
-        self.mock_auth_context = Mock()
+    @pytest.fixture
+    def test_project_id(self):
+        """Project id shared by every step of the workflow"""
+        return "mcp_integration_test"
     
     @pytest.mark.asyncio
-    async def test_full_healing_workflow_via_mcp(self):
+    async def test_full_healing_workflow_via_mcp(
+        self, healing_tools, orchestrator_tools, test_project_id, mock_request, mock_auth_context
+    ):
         """Test complete healing workflow using MCP tools"""
-        # Test sequence: generate app -> enable healing -> trigger healing -> check status
+        # Test sequence: generate app -> (health check | trigger healing | check status).
+        # Per-tool result details are covered by the unit tests above; this test only
+        # checks what crosses tool boundaries.
+        mock_report = SimpleNamespace(
+            overall_status=SimpleNamespace(value="warning"),
+            health_score=0.6,
+            issues=[],
+            recommendations=[],
+            timestamp=datetime(2024, 1, 1)
+        )
         
-        # 1. Generate application with healing
-        with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator:
-            mock_result = {
-                "project_id": self.test_project_id,
-                "status": "completed"
-            }
-            mock_orchestrator.return_value.generate_complete_application.return_value = mock_result
-            
-            app_result = await generate_application_with_healing(
-                description="Test app",
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
-            )
-            
-            self.assertTrue(app_result["success"])
-            self.assertTrue(app_result["healing_enabled"])
+        monitor = _spec_stub(_HealthMonitorSpec, **{"perform_comprehensive_health_check.return_value": mock_report})
+        healing_loop = _spec_stub(_HealingLoopSpec, **{
+            "trigger_healing_session.return_value": TEST_SESSION_ID,
+            "get_healing_status.return_value": {"status": "active"}
+        })
         
-        # 2. Perform health check
-        with patch('src.healing.healing_tools.get_health_monitor') as mock_monitor:
-            mock_report = Mock()
-            mock_report.overall_status.value = "warning"
-            mock_report.health_score = 0.6
-            mock_report.issues = [Mock()]
-            mock_report.issues[0].id = "test_issue"
-            mock_report.issues[0].type.value = "runtime_error"
-            mock_report.issues[0].severity = 7
-            mock_report.issues[0].description = "Test issue"
-            mock_report.issues[0].location = "test.py:10"
-            mock_report.recommendations = ["Fix the issue"]
-            mock_report.timestamp.isoformat.return_value = "2024-01-01T00:00:00"
-            
-            mock_monitor.return_value.perform_comprehensive_health_check.return_value = mock_report
-            
-            health_result = await perform_health_check(
-                project_id=self.test_project_id,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+        # All collaborators are patched once for the whole workflow
+        with patch('src.agents.orchestrator_mcp_tools.get_orchestrator') as mock_orchestrator, \
+             patch('src.healing.healing_tools.get_health_monitor', return_value=monitor), \
+             patch('src.healing.healing_tools.get_healing_loop', return_value=healing_loop):
+            mock_orchestrator.return_value.generate_complete_application = AsyncMock(
+                return_value={"project_id": test_project_id, "status": "completed"}
             )
             
-            self.assertTrue(health_result["success"])
-            self.assertEqual(health_result["health_status"], "warning")
-            self.assertEqual(health_result["issues_count"], 1)
-        
-        # 3. Trigger healing session
-        with patch('src.healing.healing_tools.get_healing_loop') as mock_loop:
-            mock_session_id = str(uuid.uuid4())
-            mock_loop.return_value.trigger_healing_session.return_value = mock_session_id
-            
-            healing_result = await trigger_healing_session(
-                project_id=self.test_project_id,
-                issue_description="Runtime error needs fixing",
-                issue_severity=7,
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+            # 1. Generate application with healing
+            app_result = await orchestrator_tools.generate_application_with_healing(
+                description="Test app",
+                request=mock_request,
+                auth_context=mock_auth_context
             )
-            
-            self.assertTrue(healing_result["success"])
-            self.assertTrue(healing_result["healing_session_triggered"])
-            self.assertEqual(healing_result["session_id"], mock_session_id)
-        
-        # 4. Check healing status
-        with patch('src.healing.healing_tools.get_healing_loop') as mock_loop:
-            mock_status = {
-                "status": "active",
-                "active_sessions": 1,
-                "completed_sessions": 0
-            }
-            mock_loop.return_value.get_healing_status.return_value = mock_status
-            
-            status_result = await get_healing_status(
-                request=self.mock_request,
-                auth_context=self.mock_auth_context
+            project_id = app_result["project_id"]
+            
+            # 2-4. Health check, healing trigger and status query are independent
+            health_result, healing_result, status_result = await asyncio.gather(
+                healing_tools.perform_health_check(
+                    project_id=project_id,
+                    request=mock_request,
+                    auth_context=mock_auth_context
+                ),
+                healing_tools.trigger_healing_session(
+                    project_id=project_id,
+                    issue_description="Runtime error needs fixing",
+                    issue_severity=7,
+                    request=mock_request,
+                    auth_context=mock_auth_context
+                ),
+                healing_tools.get_healing_status(
+                    request=mock_request,
+                    auth_context=mock_auth_context
+                )
             )
-            
-            self.assertTrue(status_result["success"])
-            self.assertEqual(status_result["status"], "active")
-            self.assertEqual(status_result["active_sessions"], 1)
+        
+        assert health_result["project_id"] == project_id
+        assert healing_result["project_id"] == project_id
+        assert healing_result["session_id"] == TEST_SESSION_ID
+        assert status_result["success"]
 
 
 if __name__ == "__main__":
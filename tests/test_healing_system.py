@@ -2,9 +2,12 @@
 Comprehensive test suite for the self-healing loop system
 """
 import asyncio
-import unittest
+import itertools
+import json
 import uuid
+from dataclasses import replace
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
@@ -14,460 +17,506 @@ from src.healing.solution_generator import SolutionGenerator
 from src.healing.healing_loop import HealingLoop, HealingPhase, HealingStatus
 from src.core.project_manager import ProjectManager
 
+pytestmark = pytest.mark.asyncio
 
-class TestHealthMonitor(unittest.TestCase):
+# Enum members the assertions below lean on, bound once
+SYNTAX_ERROR = IssueType.SYNTAX_ERROR
+RUNTIME_ERROR = IssueType.RUNTIME_ERROR
+LOGIC_ERROR = IssueType.LOGIC_ERROR
+IDLE = HealingStatus.IDLE
+ACTIVE = HealingStatus.ACTIVE
+IDLE_VALUE = HealingStatus.IDLE.value
+
+ANALYZER_CORRELATION_ID = "test_analyzer_123"
+GENERATOR_CORRELATION_ID = "test_generator_789"
+LOOP_CORRELATION_ID = "test_loop_heal"
+
+# Fixed reference time so issue timestamps are deterministic
+_NOW = datetime(2024, 1, 1)
+
+_ISSUE_TEMPLATE = HealthIssue(
+    id="",
+    type=RUNTIME_ERROR,
+    severity=5,
+    description="",
+    location="",
+    first_detected=_NOW
+)
+
+
+def _issue(**overrides):
+    """Copy the shared issue template, giving each copy its own fixes list"""
+    return replace(_ISSUE_TEMPLATE, suggested_fixes=[], **overrides)
+
+
+class _StubFM:
+    """Minimal SecureFileManager stand-in serving canned project files"""
+
+    def __init__(self, files, content):
+        self.files = files
+        self.content = content
+
+    async def list_project_files(self, project_id):
+        return list(self.files)
+
+    async def read_project_file(self, project_id, file_path):
+        return self.content
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay=0, result=None):
+    """Yield to the event loop once instead of waiting out ``delay``"""
+    return await _real_sleep(0, result)
+
+
+@pytest.fixture
+def instant_sleep():
+    """Make background monitoring/healing loops cycle without wall-clock waits"""
+    with patch("asyncio.sleep", new=_instant_sleep):
+        yield
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def eager_tasks():
+    """Run spawned monitoring/healing tasks eagerly where supported (3.12+)"""
+    if not hasattr(asyncio, "eager_task_factory"):
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    previous_factory = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(previous_factory)
+
+
+@pytest.fixture(scope="class")
+def shared_health_monitor():
+    """Create one health monitor shared by read-only tests"""
+    return HealthMonitor()
+
+
+@pytest.fixture(scope="module")
+def error_analyzer():
+    """Create one error analyzer shared by the module"""
+    return ErrorAnalyzer(correlation_id=ANALYZER_CORRELATION_ID)
+
+
+@pytest.fixture(scope="module")
+def solution_generator():
+    """Create one solution generator shared by the module"""
+    return SolutionGenerator(correlation_id=GENERATOR_CORRELATION_ID)
+
+
+@pytest.fixture(scope="class")
+def idle_healing_loop():
+    """Create one never-started healing loop shared by read-only tests"""
+    return HealingLoop(correlation_id=LOOP_CORRELATION_ID)
+
+
+@pytest.fixture(scope="class")
+async def integrated_healing():
+    """Create one monitor/healing loop pair shared by the integration flows"""
+    health_monitor = HealthMonitor()
+    healing_loop = HealingLoop()
+    yield health_monitor, healing_loop
+    for project_id in list(healing_loop.health_monitor.active_monitors):
+        await healing_loop.stop_healing_loop(project_id)
+    for project_id in list(health_monitor.active_monitors):
+        await health_monitor.stop_monitoring(project_id)
+
+
+class TestHealthMonitor:
     """Test cases for HealthMonitor"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.health_monitor = HealthMonitor()
-        self.test_project_id = "test_project_123"
+    test_project_id = "test_project_123"
+    
+    @pytest.fixture
+    async def health_monitor(self):
+        """Create test health monitor, stopping any monitors it started"""
+        monitor = HealthMonitor()
+        yield monitor
+        for project_id in list(monitor.active_monitors):
+            await monitor.stop_monitoring(project_id)
     
-    @pytest.mark.asyncio
-    async def test_health_monitor_initialization(self):
+    async def test_health_monitor_initialization(self, shared_health_monitor):
         """Test health monitor initializes correctly"""
-        self.assertIsNotNone(self.health_monitor)
-        self.assertEqual(len(self.health_monitor.monitors), 0)
-        self.assertEqual(len(self.health_monitor.health_history), 0)
+        assert shared_health_monitor is not None
+        assert len(shared_health_monitor.active_monitors) == 0
+        assert len(shared_health_monitor.health_history) == 0
     
-    @pytest.mark.asyncio
-    async def test_health_check_creation(self):
+    async def test_health_check_creation(self, health_monitor):
         """Test creating a basic health check"""
-        # Mock project structure for testing
-        with patch('src.core.file_manager.SecureFileManager') as mock_fm:
-            mock_fm.return_value.read_file.return_value = "print('hello world')"
-            mock_fm.return_value.list_files.return_value = ["main.py", "requirements.txt"]
-            
-            health_report = await self.health_monitor.perform_comprehensive_health_check(
-                self.test_project_id
-            )
-            
-            self.assertIsNotNone(health_report)
-            self.assertEqual(health_report.project_id, self.test_project_id)
-            self.assertIsInstance(health_report.health_score, float)
-            self.assertGreaterEqual(health_report.health_score, 0.0)
-            self.assertLessEqual(health_report.health_score, 1.0)
+        # Stub project structure for testing
+        health_monitor.file_manager = _StubFM(
+            ["main.py", "requirements.txt"], "print('hello world')"
+        )
+        
+        health_report = await health_monitor.perform_comprehensive_health_check(
+            self.test_project_id
+        )
+        
+        assert health_report is not None
+        assert health_report.project_id == self.test_project_id
+        assert isinstance(health_report.health_score, float)
+        assert health_report.health_score >= 0.0
+        assert health_report.health_score <= 1.0
     
-    @pytest.mark.asyncio
-    async def test_continuous_monitoring_start_stop(self):
+    async def test_continuous_monitoring_start_stop(self, health_monitor):
         """Test starting and stopping continuous monitoring"""
         # Start monitoring
-        monitor_task = await self.health_monitor.start_continuous_monitoring(
+        await health_monitor.start_continuous_monitoring(
             self.test_project_id, interval_seconds=1
         )
         
-        self.assertIn(self.test_project_id, self.health_monitor.monitors)
+        assert self.test_project_id in health_monitor.active_monitors
         
         # Let it run briefly
-        await asyncio.sleep(2.1)
+        await asyncio.sleep(0)
         
         # Stop monitoring
-        await self.health_monitor.stop_monitoring(self.test_project_id)
+        await health_monitor.stop_monitoring(self.test_project_id)
         
-        self.assertNotIn(self.test_project_id, self.health_monitor.monitors)
+        assert self.test_project_id not in health_monitor.active_monitors
     
-    @pytest.mark.asyncio
-    async def test_issue_detection(self):
+    async def test_issue_detection(self, health_monitor):
         """Test various issue detection scenarios"""
-        # Mock error scenarios
-        with patch('src.core.file_manager.SecureFileManager') as mock_fm:
-            # Syntax error scenario
-            mock_fm.return_value.read_file.return_value = "print('unclosed string"
-            mock_fm.return_value.list_files.return_value = ["broken.py"]
-            
-            health_report = await self.health_monitor.perform_comprehensive_health_check(
-                self.test_project_id
-            )
-            
-            # Should detect syntax error
-            syntax_issues = [issue for issue in health_report.issues 
-                           if issue.type == IssueType.SYNTAX_ERROR]
-            self.assertGreater(len(syntax_issues), 0)
+        # Syntax error scenario
+        health_monitor.file_manager = _StubFM(
+            ["broken.py"], "print('unclosed string"
+        )
+        
+        health_report = await health_monitor.perform_comprehensive_health_check(
+            self.test_project_id
+        )
+        
+        # Should detect syntax error
+        syntax_issues = [issue for issue in health_report.issues 
+                       if issue.type == SYNTAX_ERROR]
+        assert len(syntax_issues) > 0
     
-    @pytest.mark.asyncio
-    async def test_health_history_tracking(self):
+    async def test_health_history_tracking(self, health_monitor, instant_sleep):
         """Test health history is properly tracked"""
-        # Perform multiple health checks
-        for i in range(3):
-            await self.health_monitor.perform_comprehensive_health_check(
-                self.test_project_id
+        # Tick the monitor's clock one second per read so reports get
+        # distinct, increasing timestamps without real waits
+        ticks = (_NOW + timedelta(seconds=i) for i in itertools.count())
+        clock = Mock(wraps=datetime, utcnow=Mock(side_effect=ticks))
+        
+        # Stub project files once, outside the check loop
+        health_monitor.file_manager = _StubFM(
+            ["main.py", "requirements.txt"], "print('hello world')"
+        )
+        
+        # History is recorded by the monitoring loop, one report per cycle
+        with patch("src.healing.health_monitor.datetime", new=clock):
+            await health_monitor.start_continuous_monitoring(
+                self.test_project_id, interval_seconds=1
             )
-            await asyncio.sleep(0.1)
+            while len(health_monitor.health_history.get(self.test_project_id, [])) < 3:
+                await asyncio.sleep(0)
+            await health_monitor.stop_monitoring(self.test_project_id)
         
         # Check history
-        history = self.health_monitor.get_health_history(self.test_project_id)
-        self.assertGreaterEqual(len(history), 3)
+        history = health_monitor.get_health_history(self.test_project_id)
+        assert len(history) >= 3
         
         # Check chronological order
         timestamps = [report.timestamp for report in history]
-        self.assertEqual(timestamps, sorted(timestamps))
+        assert timestamps == sorted(timestamps)
 
 
-class TestErrorAnalyzer(unittest.TestCase):
+class TestErrorAnalyzer:
     """Test cases for ErrorAnalyzer"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.error_analyzer = ErrorAnalyzer(correlation_id="test_analyzer_123")
-        self.test_project_id = "test_project_456"
-    
-    @pytest.mark.asyncio
-    async def test_error_analyzer_initialization(self):
+    async def test_error_analyzer_initialization(self, error_analyzer):
         """Test error analyzer initializes correctly"""
-        self.assertIsNotNone(self.error_analyzer)
-        self.assertGreater(len(self.error_analyzer.error_patterns), 0)
+        assert error_analyzer is not None
+        assert len(error_analyzer.error_patterns) > 0
     
-    @pytest.mark.asyncio
-    async def test_pattern_matching(self):
+    async def test_pattern_matching(self, error_analyzer, monkeypatch):
         """Test error pattern matching"""
-        # Create test issue
-        test_issue = HealthIssue(
-            id="test_issue_1",
-            type=IssueType.SYNTAX_ERROR,
-            severity=7,
-            description="SyntaxError: invalid syntax",
-            location="test.py:10",
-            error_message="SyntaxError: invalid syntax (test.py, line 10)",
-            first_detected=datetime.utcnow()
-        )
+        # Without an LLM the classification comes from the matched pattern
+        monkeypatch.setattr(error_analyzer, "llm_manager", None)
         
-        # Analyze error
-        analysis = await self.error_analyzer.analyze_error(test_issue, self.test_project_id)
+        analysis = await error_analyzer.analyze_error(
+            "SyntaxError: invalid syntax (test.py, line 10)"
+        )
         
-        self.assertIsNotNone(analysis)
-        self.assertEqual(analysis.issue_id, test_issue.id)
-        self.assertIsNotNone(analysis.analysis_type)
-        self.assertIsInstance(analysis.confidence_score, float)
+        assert analysis["pattern_match"]["issue_type"] == SYNTAX_ERROR.value
+        classification = analysis["error_classification"]
+        assert classification["primary_type"] == SYNTAX_ERROR.value
+        assert isinstance(classification["confidence"], float)
     
-    @pytest.mark.asyncio
-    async def test_llm_analysis(self):
+    async def test_llm_analysis(self, error_analyzer, monkeypatch):
         """Test LLM-based error analysis"""
-        with patch('src.core.llm_manager.LLMManager') as mock_llm:
-            mock_llm.return_value.generate_response.return_value = {
-                "root_cause": "Missing semicolon",
-                "impact_assessment": "High - prevents compilation",
-                "urgency": "high",
-                "recommendations": ["Add semicolon at line 10"]
-            }
-            
-            test_issue = HealthIssue(
-                id="test_issue_2",
-                type=IssueType.RUNTIME_ERROR,
-                severity=8,
-                description="Complex runtime error",
-                location="complex.py:50",
-                error_message="AttributeError: 'NoneType' object has no attribute 'value'",
-                first_detected=datetime.utcnow()
-            )
-            
-            analysis = await self.error_analyzer.analyze_error(test_issue, self.test_project_id)
-            
-            self.assertIsNotNone(analysis.root_cause_analysis)
-            self.assertIsNotNone(analysis.impact_assessment)
-    
-    @pytest.mark.asyncio
-    async def test_context_gathering(self):
-        """Test error context gathering"""
-        with patch('src.core.file_manager.SecureFileManager') as mock_fm:
-            mock_fm.return_value.read_file.return_value = "test file content"
-            mock_fm.return_value.list_files.return_value = ["test.py", "utils.py"]
-            
-            test_issue = HealthIssue(
-                id="test_issue_3",
-                type=IssueType.LOGIC_ERROR,
-                severity=6,
-                description="Logic error in calculation",
-                location="calc.py:25",
-                first_detected=datetime.utcnow()
-            )
-            
-            context = await self.error_analyzer._gather_error_context(
-                test_issue, self.test_project_id
-            )
-            
-            self.assertIsInstance(context, dict)
-            self.assertIn("file_content", context)
-            self.assertIn("surrounding_files", context)
+        replies = {
+            "error_analysis": {"primary_type": RUNTIME_ERROR.value, "severity": 8, "confidence": 0.9},
+            "root_cause_analysis": [{"cause": "Missing null check", "confidence": 0.9}],
+            "impact_assessment": {"user_experience": "High - request fails"},
+            "fix_recommendations": [{"action": "Guard against None before reading value"}]
+        }
+        
+        async def complete(prompt, metadata, **kwargs):
+            return SimpleNamespace(content=json.dumps(replies[metadata["operation"]]))
+        
+        monkeypatch.setattr(
+            error_analyzer, "llm_manager",
+            SimpleNamespace(generate_completion=AsyncMock(side_effect=complete))
+        )
+        
+        analysis = await error_analyzer.analyze_error(
+            "AttributeError: 'NoneType' object has no attribute 'value'",
+            code_context="total = item.value"
+        )
+        
+        assert analysis["error_classification"]["primary_type"] == RUNTIME_ERROR.value
+        assert analysis["error_classification"]["severity"] == 8
+        assert analysis["root_causes"][0]["cause"] == "Missing null check"
+        assert analysis["impact_assessment"] is not None
 
 
-class TestSolutionGenerator(unittest.TestCase):
+class TestSolutionGenerator:
     """Test cases for SolutionGenerator"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.solution_generator = SolutionGenerator(correlation_id="test_generator_789")
-        self.test_project_id = "test_project_789"
+    test_project_id = "test_project_789"
     
-    @pytest.mark.asyncio
-    async def test_solution_generator_initialization(self):
+    @pytest.fixture
+    def offline_generator(self, solution_generator, monkeypatch):
+        """Shared generator using its built-in candidates and plans instead of an LLM"""
+        monkeypatch.setattr(solution_generator, "llm_manager", None)
+        monkeypatch.setattr(solution_generator, "file_manager", None)
+        return solution_generator
+    
+    async def test_solution_generator_initialization(self, solution_generator):
         """Test solution generator initializes correctly"""
-        self.assertIsNotNone(self.solution_generator)
-        self.assertGreater(len(self.solution_generator.solution_templates), 0)
+        assert solution_generator is not None
+        assert solution_generator.error_analyzer is not None
+        assert solution_generator.generation_config["max_solutions"] > 0
     
-    @pytest.mark.asyncio
-    async def test_solution_generation(self):
+    async def test_context_gathering(self, solution_generator, monkeypatch):
+        """Test project context gathering"""
+        monkeypatch.setattr(
+            solution_generator, "file_manager",
+            _StubFM(["main.py", "utils.py", "requirements.txt"], "test file content")
+        )
+        
+        context = await solution_generator._gather_project_context(self.test_project_id, None)
+        
+        assert context["project_id"] == self.test_project_id
+        structure = context["project_structure"]
+        assert structure["total_files"] == 3
+        assert structure["file_types"]["py"] == 2
+        assert "main.py" in structure["key_files"]
+        assert "technology_stack" in context
+    
+    async def test_solution_generation(self, offline_generator):
         """Test basic solution generation"""
-        with patch('src.healing.error_analyzer.ErrorAnalyzer') as mock_analyzer:
-            # Mock error analysis
-            mock_analysis = Mock()
-            mock_analysis.issue_id = "test_issue_1"
-            mock_analysis.root_cause_analysis = "Missing import statement"
-            mock_analysis.impact_assessment = "Medium impact"
-            mock_analysis.confidence_score = 0.85
-            
-            mock_analyzer.return_value.analyze_error.return_value = mock_analysis
-            
-            test_issue = HealthIssue(
-                id="test_issue_1",
-                type=IssueType.DEPENDENCY_ISSUE,
-                severity=5,
-                description="ModuleNotFoundError: No module named 'requests'",
-                location="main.py:1",
-                error_message="ModuleNotFoundError: No module named 'requests'",
-                first_detected=datetime.utcnow()
-            )
-            
-            solutions = await self.solution_generator.generate_solutions(
-                test_issue, self.test_project_id
-            )
-            
-            self.assertIsInstance(solutions, list)
-            self.assertGreater(len(solutions), 0)
-            
-            # Check solution structure
-            solution = solutions[0]
-            self.assertIsNotNone(solution.solution_id)
-            self.assertIsNotNone(solution.solution_type)
-            self.assertIsNotNone(solution.implementation_plan)
+        error_analysis = {
+            "error_classification": {"primary_type": IssueType.DEPENDENCY_ISSUE.value, "severity": 5}
+        }
+        
+        solutions = await offline_generator.generate_solutions(
+            error_analysis, self.test_project_id
+        )
+        
+        assert isinstance(solutions, list)
+        assert len(solutions) > 0
+        
+        # Check solution structure
+        solution = solutions[0]
+        assert solution.solution_id is not None
+        assert solution.solution_type == "dependency_update"
+        assert solution.implementation_steps
     
-    @pytest.mark.asyncio
-    async def test_solution_evaluation(self):
+    async def test_solution_evaluation(self, offline_generator):
         """Test solution evaluation and ranking"""
-        with patch('src.core.llm_manager.LLMManager') as mock_llm:
-            mock_llm.return_value.generate_response.return_value = {
-                "feasibility_score": 0.9,
-                "risk_assessment": "Low risk",
-                "implementation_complexity": "Simple",
-                "estimated_success_rate": 0.95
-            }
-            
-            test_issue = HealthIssue(
-                id="test_issue_2",
-                type=IssueType.CONFIGURATION_ERROR,
-                severity=4,
-                description="Configuration file missing",
-                location="config/",
-                first_detected=datetime.utcnow()
-            )
-            
-            solutions = await self.solution_generator.generate_solutions(
-                test_issue, self.test_project_id
-            )
-            
-            # Should have ranked solutions
-            self.assertGreater(len(solutions), 0)
-            
-            # Check ranking (solutions should be sorted by score)
-            if len(solutions) > 1:
-                self.assertGreaterEqual(
-                    solutions[0].feasibility_score,
-                    solutions[1].feasibility_score
-                )
+        error_analysis = {"error_classification": {"severity": 4}}
+        candidates = [
+            {"solution_type": "code_fix", "confidence": 0.7, "implementation_complexity": 6, "estimated_time_minutes": 45},
+            {"solution_type": "code_fix", "confidence": 0.9, "implementation_complexity": 2, "estimated_time_minutes": 10},
+            {"solution_type": "manual_review", "confidence": 0.3, "implementation_complexity": 8, "estimated_time_minutes": 120}
+        ]
+        
+        evaluated = await offline_generator._evaluate_solutions(candidates, error_analysis, {})
+        
+        # Low-confidence candidates are dropped and the rest ranked by score
+        assert [candidate["confidence"] for candidate in evaluated] == [0.9, 0.7]
+        assert evaluated[0]["evaluation_score"] >= evaluated[1]["evaluation_score"]
     
-    @pytest.mark.asyncio
-    async def test_implementation_plan_generation(self):
+    async def test_implementation_plan_generation(self, offline_generator):
         """Test implementation plan generation"""
-        test_issue = HealthIssue(
-            id="test_issue_3",
-            type=IssueType.SYNTAX_ERROR,
-            severity=7,
-            description="Syntax error in function",
-            location="utils.py:15",
-            error_message="SyntaxError: invalid syntax",
-            first_detected=datetime.utcnow()
-        )
+        error_analysis = {
+            "error_classification": {"primary_type": SYNTAX_ERROR.value, "severity": 7}
+        }
         
-        solutions = await self.solution_generator.generate_solutions(
-            test_issue, self.test_project_id
+        solutions = await offline_generator.generate_solutions(
+            error_analysis, self.test_project_id
         )
         
         # Check implementation plan structure
         solution = solutions[0]
-        plan = solution.implementation_plan
-        
-        self.assertIsInstance(plan, dict)
-        self.assertIn("steps", plan)
-        self.assertIsInstance(plan["steps"], list)
-        self.assertGreater(len(plan["steps"]), 0)
+        assert isinstance(solution.implementation_steps, list)
+        assert len(solution.implementation_steps) > 0
+        assert len(solution.rollback_plan) > 0
+        assert len(solution.verification_steps) > 0
 
 
-class TestHealingLoop(unittest.TestCase):
+class TestHealingLoop:
     """Test cases for HealingLoop orchestrator"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.healing_loop = HealingLoop(correlation_id="test_loop_heal")
-        self.test_project_id = "test_project_loop"
+    test_project_id = "test_project_loop"
     
-    @pytest.mark.asyncio
-    async def test_healing_loop_initialization(self):
+    @pytest.fixture
+    async def healing_loop(self):
+        """Create test healing loop, stopping it for every monitored project"""
+        loop = HealingLoop(correlation_id=LOOP_CORRELATION_ID)
+        yield loop
+        for project_id in list(loop.health_monitor.active_monitors):
+            await loop.stop_healing_loop(project_id)
+    
+    async def test_healing_loop_initialization(self, idle_healing_loop):
         """Test healing loop initializes correctly"""
-        self.assertIsNotNone(self.healing_loop)
-        self.assertEqual(self.healing_loop.status, HealingStatus.IDLE)
-        self.assertEqual(len(self.healing_loop.active_sessions), 0)
+        assert idle_healing_loop is not None
+        assert idle_healing_loop.status == IDLE
+        assert len(idle_healing_loop.active_sessions) == 0
     
-    @pytest.mark.asyncio
-    async def test_healing_loop_start_stop(self):
+    async def test_healing_loop_start_stop(self, healing_loop):
         """Test starting and stopping healing loop"""
         # Start healing loop
-        healing_task = await self.healing_loop.start_healing_loop(self.test_project_id)
+        await healing_loop.start_healing_loop(self.test_project_id)
         
-        self.assertEqual(self.healing_loop.status, HealingStatus.ACTIVE)
+        assert healing_loop.status == ACTIVE
         
         # Stop healing loop
-        await self.healing_loop.stop_healing_loop(self.test_project_id)
+        await healing_loop.stop_healing_loop(self.test_project_id)
         
-        self.assertEqual(self.healing_loop.status, HealingStatus.IDLE)
+        assert healing_loop.status == IDLE
     
-    @pytest.mark.asyncio
-    async def test_healing_session_trigger(self):
+    async def test_healing_session_trigger(self, healing_loop):
         """Test triggering a healing session"""
         # Start healing loop first
-        await self.healing_loop.start_healing_loop(self.test_project_id)
+        await healing_loop.start_healing_loop(self.test_project_id)
         
-        test_issue = HealthIssue(
+        test_issue = _issue(
             id="test_session_issue",
-            type=IssueType.RUNTIME_ERROR,
+            type=RUNTIME_ERROR,
             severity=8,
             description="Critical runtime error",
             location="app.py:100",
-            error_message="ValueError: invalid literal for int()",
-            first_detected=datetime.utcnow()
+            error_message="ValueError: invalid literal for int()"
         )
         
         # Trigger healing session
-        session_id = await self.healing_loop.trigger_healing_session(
+        session_id = await healing_loop.trigger_healing_session(
             self.test_project_id, test_issue
         )
         
-        self.assertIsNotNone(session_id)
-        self.assertIn(session_id, self.healing_loop.active_sessions)
+        assert session_id is not None
+        assert session_id in healing_loop.active_sessions
         
         # Let healing process run briefly
-        await asyncio.sleep(1)
+        await asyncio.sleep(0)
         
         # Check session status
-        session_details = self.healing_loop.get_session_details(session_id)
-        self.assertIsNotNone(session_details)
+        session_details = healing_loop.get_session_details(session_id)
+        assert session_details is not None
     
-    @pytest.mark.asyncio
-    async def test_concurrent_healing_sessions(self):
+    async def test_concurrent_healing_sessions(self, healing_loop):
         """Test handling multiple concurrent healing sessions"""
-        await self.healing_loop.start_healing_loop(self.test_project_id)
+        await healing_loop.start_healing_loop(self.test_project_id)
         
         # Create multiple issues
-        issues = []
-        for i in range(3):
-            issue = HealthIssue(
+        issues = [
+            _issue(
                 id=f"concurrent_issue_{i}",
-                type=IssueType.LOGIC_ERROR,
+                type=LOGIC_ERROR,
                 severity=5 + i,
                 description=f"Test issue {i}",
-                location=f"test_{i}.py:10",
-                first_detected=datetime.utcnow()
+                location=f"test_{i}.py:10"
             )
-            issues.append(issue)
+            for i in range(3)
+        ]
         
         # Trigger concurrent sessions
-        session_ids = []
-        for issue in issues:
-            session_id = await self.healing_loop.trigger_healing_session(
-                self.test_project_id, issue
-            )
-            if session_id:
-                session_ids.append(session_id)
+        results = await asyncio.gather(*(
+            healing_loop.trigger_healing_session(self.test_project_id, issue)
+            for issue in issues
+        ))
+        session_ids = [session_id for session_id in results if session_id]
         
         # Should handle multiple sessions (up to limit)
-        self.assertGreater(len(session_ids), 0)
-        self.assertLessEqual(len(session_ids), self.healing_loop.max_concurrent_sessions)
+        assert len(session_ids) > 0
+        assert len(session_ids) <= healing_loop.config["max_concurrent_sessions"]
     
-    @pytest.mark.asyncio
-    async def test_healing_status_reporting(self):
+    async def test_healing_status_reporting(self, idle_healing_loop):
         """Test healing status reporting"""
-        status = self.healing_loop.get_healing_status()
+        status = idle_healing_loop.get_healing_status()
         
-        self.assertIsInstance(status, dict)
-        self.assertIn("status", status)
-        self.assertIn("active_sessions", status)
-        self.assertIn("completed_sessions", status)
-        self.assertEqual(status["status"], HealingStatus.IDLE.value)
+        assert isinstance(status, dict)
+        assert "status" in status
+        assert "active_sessions" in status
+        assert "completed_sessions" in status
+        assert status["status"] == IDLE_VALUE
 
 
-class TestIntegrationScenarios(unittest.TestCase):
+class TestIntegrationScenarios:
     """Integration tests for complete healing scenarios"""
     
-    def setUp(self):
-        """Set up integration test fixtures"""
-        self.health_monitor = HealthMonitor()
-        self.healing_loop = HealingLoop()
-        self.test_project_id = "integration_test_project"
+    test_project_id = "integration_test_project"
     
-    @pytest.mark.asyncio
-    async def test_end_to_end_healing_flow(self):
+    async def test_end_to_end_healing_flow(self, integrated_healing):
         """Test complete end-to-end healing flow"""
+        health_monitor, healing_loop = integrated_healing
+        
         # 1. Start healing loop
-        await self.healing_loop.start_healing_loop(self.test_project_id)
+        await healing_loop.start_healing_loop(self.test_project_id)
         
         # 2. Start health monitoring
-        await self.health_monitor.start_continuous_monitoring(
+        await health_monitor.start_continuous_monitoring(
             self.test_project_id, interval_seconds=2
         )
         
         # 3. Simulate an issue being detected
-        test_issue = HealthIssue(
+        test_issue = _issue(
             id="integration_issue",
             type=IssueType.API_ERROR,
             severity=9,
             description="API endpoint returning 500 errors",
             location="api/users.py:45",
-            error_message="Internal Server Error",
-            first_detected=datetime.utcnow()
+            error_message="Internal Server Error"
         )
         
         # 4. Trigger healing
-        session_id = await self.healing_loop.trigger_healing_session(
+        session_id = await healing_loop.trigger_healing_session(
             self.test_project_id, test_issue
         )
         
-        self.assertIsNotNone(session_id)
+        assert session_id is not None
         
         # 5. Let healing process run
-        await asyncio.sleep(3)
+        await asyncio.sleep(0)
         
         # 6. Check results
-        session_details = self.healing_loop.get_session_details(session_id)
-        self.assertIsNotNone(session_details)
-        
-        # 7. Cleanup
-        await self.health_monitor.stop_monitoring(self.test_project_id)
-        await self.healing_loop.stop_healing_loop(self.test_project_id)
+        session_details = healing_loop.get_session_details(session_id)
+        assert session_details is not None
     
-    @pytest.mark.asyncio
+    @pytest.mark.integration
     async def test_healing_with_orchestrator_integration(self):
         """Test healing integration with agent orchestrator"""
-        from src.agents.orchestrator import AgentOrchestrator
+        orchestrator_module = pytest.importorskip("src.agents.orchestrator")
         
         # Create orchestrator with healing enabled
-        orchestrator = AgentOrchestrator()
+        orchestrator = orchestrator_module.AgentOrchestrator()
         
         # Enable healing for test project
         result = await orchestrator.enable_healing_for_project(self.test_project_id)
-        self.assertTrue(result["success"])
+        assert result["success"]
         
         # Check health status
         health_status = await orchestrator.get_project_health_status(self.test_project_id)
-        self.assertEqual(health_status["project_id"], self.test_project_id)
-        self.assertTrue(health_status["healing_enabled"])
+        assert health_status["project_id"] == self.test_project_id
+        assert health_status["healing_enabled"]
         
         # Cleanup
         await orchestrator.disable_healing_for_project(self.test_project_id)
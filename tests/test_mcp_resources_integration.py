@@ -2,38 +2,35 @@
 Integration tests for MCP resources
 """
 import pytest
-import json
-from unittest.mock import AsyncMock, patch, Mock
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
+import orjson
+import os
+from unittest.mock import AsyncMock, Mock, patch
 
-from src.main import app, mcp_server
-from src.resources.project_resources import project_structure_resource, project_code_resource, system_metrics_resource, mcp_capabilities_resource, analytics_dashboard_resource
+from src.core.file_manager import SecureFileManager
+from src.resources import project_resources
+
+MAIN_FILE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 3,
+    "method": "resources/read",
+    "params": {"uri": "project://files/src/main.py"}
+}
+
+
+def _project_file_manager(mocker, tmp_path, main_content):
+    """Serve the default project's src/main.py from a file manager rooted at tmp_path"""
+    file_manager = SecureFileManager(str(tmp_path))
+    (tmp_path / "default" / "src").mkdir(parents=True)
+    (tmp_path / "default" / "src" / "main.py").write_text(main_content)
+    mocker.patch('src.resources.project_resources.SecureFileManager', return_value=file_manager)
+    return file_manager
 
 
 class TestMCPResourcesIntegration:
     """Test MCP resources integration"""
     
-    @pytest.fixture
-    def app(self, initialized_services):
-        """Use main FastAPI app with initialized services"""
-        return app
-    
-    @pytest.fixture
-    def mcp_server_instance(self, initialized_services):
-        """Use initialized MCP server"""
-        return mcp_server
-    
-    @pytest.fixture
-    def client(self, app, mcp_server_instance):
-        """Create test client"""
-        return TestClient(app)
-    
-    @pytest.mark.asyncio
     async def test_resources_registration(self, initialized_services):
         """Test resources are properly registered"""
-        from src.main import mcp_server
-        
         expected_uris = [
             "project://structure",
             "project://files/src/main.py",
@@ -41,13 +38,12 @@ class TestMCPResourcesIntegration:
             "server://capabilities"
         ]
         
-        resource_uris = list(mcp_server.resources.keys())
+        resource_uris = list(initialized_services.resources.keys())
         
         for uri in expected_uris:
             assert uri in resource_uris, f"Resource '{uri}' not found in registered resources: {resource_uris}"
     
-    @pytest.mark.asyncio
-    async def test_project_structure_resource(self, client):
+    async def test_project_structure_resource(self, client, mocker):
         """Test project structure resource"""
         request_data = {
             "jsonrpc": "2.0",
@@ -58,15 +54,13 @@ class TestMCPResourcesIntegration:
             }
         }
         
-        with patch('src.resources.project_resources.ProjectManager') as mock_pm:
-            mock_pm.return_value.get_project_structure.return_value = {
-                "root": "/test/project",
-                "structure": {"src": ["main.py"]}
-            }
-            
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                response = client.post("/mcp/resources/read", json=request_data)
+        mock_pm = mocker.patch('src.resources.project_resources.ProjectManager')
+        mock_pm.return_value.get_project_structure = AsyncMock(return_value={
+            "root": "/test/project",
+            "structure": {"src": ["main.py"]}
+        })
+        
+        response = await client.post("/mcp/resources/read", json=request_data)
         
         assert response.status_code == 200
         
@@ -78,9 +72,9 @@ class TestMCPResourcesIntegration:
         assert len(contents) > 0
         assert contents[0]["uri"] == "project://structure"
         assert contents[0]["mimeType"] == "application/json"
+        assert orjson.loads(contents[0]["text"])["root"] == "/test/project"
     
-    @pytest.mark.asyncio
-    async def test_project_files_resource(self, client):
+    async def test_project_files_resource(self, client, mocker, tmp_path):
         """Test project files resource"""
         request_data = {
             "jsonrpc": "2.0",
@@ -91,12 +85,9 @@ class TestMCPResourcesIntegration:
             }
         }
         
-        with patch('src.resources.project_resources.SecureFileManager') as mock_sfm:
-            mock_sfm.return_value.read_file.return_value = "print('Hello, World!')"
-            
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                response = client.post("/mcp/resources/read", json=request_data)
+        _project_file_manager(mocker, tmp_path, "print('Hello, World!')")
+        
+        response = await client.post("/mcp/resources/read", json=request_data)
         
         assert response.status_code == 200
         
@@ -107,8 +98,43 @@ class TestMCPResourcesIntegration:
         assert contents[0]["mimeType"] == "text/plain"
         assert "Hello, World!" in contents[0]["text"]
     
-    @pytest.mark.asyncio
-    async def test_system_metrics_resource(self, client):
+    async def test_project_file_cache_hit(self, client, mocker, tmp_path):
+        """Test an unchanged project file is served from the cache"""
+        file_manager = _project_file_manager(mocker, tmp_path, "print('cached')")
+        read_spy = mocker.spy(file_manager, "read_project_file")
+        
+        for _ in range(2):
+            response = await client.post("/mcp/resources/read", json=MAIN_FILE_REQUEST)
+            assert response.json()["result"]["contents"][0]["text"] == "print('cached')"
+        
+        assert read_spy.call_count == 1
+    
+    async def test_project_file_cache_invalidated_after_write(self, client, mocker, tmp_path):
+        """Test a rewritten project file is re-read even with an unchanged mtime"""
+        file_manager = _project_file_manager(mocker, tmp_path, "print('old')")
+        response = await client.post("/mcp/resources/read", json=MAIN_FILE_REQUEST)
+        assert response.json()["result"]["contents"][0]["text"] == "print('old')"
+        
+        # Rewrite within the same timestamp tick, as on a coarse-mtime filesystem
+        main_file = tmp_path / "default" / "src" / "main.py"
+        stat = main_file.stat()
+        await file_manager.write_project_file("default", "src/main.py", "print('rewritten')")
+        os.utime(main_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        response = await client.post("/mcp/resources/read", json=MAIN_FILE_REQUEST)
+        assert response.json()["result"]["contents"][0]["text"] == "print('rewritten')"
+    
+    async def test_project_file_rejects_unsafe_path(self, mocker, tmp_path):
+        """Test a path outside the project is rejected before it is looked up"""
+        _project_file_manager(mocker, tmp_path, "print('ok')")
+        (tmp_path / "secret.txt").write_text("secret")
+        resource_os = mocker.patch.object(project_resources, "os", wraps=os)
+        
+        with pytest.raises(ValueError, match="Unsafe file path"):
+            await project_resources._read_project_file("default", "../secret.txt")
+        resource_os.stat.assert_not_called()
+    
+    async def test_system_metrics_resource(self, client, mocker, monkeypatch):
         """Test system metrics resource"""
         request_data = {
             "jsonrpc": "2.0",
@@ -119,15 +145,19 @@ class TestMCPResourcesIntegration:
             }
         }
         
-        with patch('psutil.cpu_percent', return_value=25.5):
-            with patch('psutil.virtual_memory') as mock_memory:
-                mock_memory.return_value.percent = 45.2
-                with patch('psutil.disk_usage') as mock_disk:
-                    mock_disk.return_value.percent = 67.8
-                    
-                    with patch('src.core.mcp_server.getattr') as mock_getattr:
-                        mock_getattr.return_value = "test-correlation-id"
-                        response = client.post("/mcp/resources/read", json=request_data)
+        mock_pm = mocker.patch('src.resources.project_resources.ProjectManager')
+        mock_pm.return_value.get_active_project_count = AsyncMock(return_value=3)
+        
+        # Start from an empty snapshot so the read samples the mocked psutil
+        monkeypatch.setattr(project_resources, "_metrics_snapshot", {})
+        monkeypatch.setattr(project_resources, "_metrics_sampled_at", None)
+        with patch.multiple(
+            'psutil',
+            cpu_percent=Mock(return_value=25.5),
+            virtual_memory=Mock(return_value=Mock(total=16 * 1024**3, available=8 * 1024**3, percent=45.2)),
+            disk_usage=Mock(return_value=Mock(total=100 * 1024**3, free=30 * 1024**3, used=70 * 1024**3))
+        ):
+            response = await client.post("/mcp/resources/read", json=request_data)
         
         assert response.status_code == 200
         
@@ -138,12 +168,36 @@ class TestMCPResourcesIntegration:
         assert contents[0]["mimeType"] == "application/json"
         
         # Parse metrics data
-        metrics_data = json.loads(contents[0]["text"])
-        assert "cpu_usage" in metrics_data
-        assert "memory_usage" in metrics_data
-        assert "disk_usage" in metrics_data
+        metrics_data = orjson.loads(contents[0]["text"])
+        performance = metrics_data["system_performance"]
+        assert performance["cpu"]["usage_percent"] == 25.5
+        assert performance["memory"]["usage_percent"] == 45.2
+        assert performance["memory"]["total_gb"] == 16.0
+        assert performance["disk"]["usage_percent"] == 70.0
+        assert metrics_data["application_metrics"]["active_projects"] == 3
+    
+    async def test_system_metrics_refresh_when_stale(self, monkeypatch):
+        """Test the metrics snapshot is reused while fresh and resampled once stale"""
+        monkeypatch.setattr(project_resources, "_metrics_snapshot", {})
+        monkeypatch.setattr(project_resources, "_metrics_sampled_at", None)
+        cpu_percent = Mock(return_value=10.0)
+        
+        with patch('psutil.cpu_percent', cpu_percent):
+            assert project_resources._current_system_metrics()["cpu"]["usage_percent"] == 10.0
+            
+            cpu_percent.return_value = 20.0
+            assert project_resources._current_system_metrics()["cpu"]["usage_percent"] == 10.0
+            
+            # Age the snapshot past the sample interval
+            monkeypatch.setattr(
+                project_resources, "_metrics_sampled_at",
+                project_resources._metrics_sampled_at - project_resources.METRICS_SAMPLE_INTERVAL
+            )
+            assert project_resources._current_system_metrics()["cpu"]["usage_percent"] == 20.0
+        
+        # Only the first sample blocks to get a cpu baseline
+        assert [c.kwargs["interval"] for c in cpu_percent.call_args_list] == [0.1, None]
     
-    @pytest.mark.asyncio
     async def test_server_capabilities_resource(self, client):
         """Test server capabilities resource"""
         request_data = {
@@ -155,9 +209,7 @@ class TestMCPResourcesIntegration:
             }
         }
         
-        with patch('src.core.mcp_server.getattr') as mock_getattr:
-            mock_getattr.return_value = "test-correlation-id"
-            response = client.post("/mcp/resources/read", json=request_data)
+        response = await client.post("/mcp/resources/read", json=request_data)
         
         assert response.status_code == 200
         
@@ -168,48 +220,63 @@ class TestMCPResourcesIntegration:
         assert contents[0]["mimeType"] == "application/json"
         
         # Parse capabilities data
-        capabilities_data = json.loads(contents[0]["text"])
-        assert "tools" in capabilities_data
-        assert "resources" in capabilities_data
+        capabilities_data = orjson.loads(contents[0]["text"])
+        assert "tools" in capabilities_data["capabilities"]
+        assert "resources" in capabilities_data["capabilities"]
         assert "server_info" in capabilities_data
     
-    @pytest.mark.asyncio
-    async def test_analytics_summary_resource(self, client):
-        """Test analytics summary resource"""
+    async def test_server_capabilities_follow_reregistration(self, client, initialized_services):
+        """Test capabilities reflect a tool re-registered with new metadata"""
         request_data = {
             "jsonrpc": "2.0",
-            "id": 6,
+            "id": 5,
             "method": "resources/read",
             "params": {
-                "uri": "analytics://summary"
+                "uri": "server://capabilities"
             }
         }
         
-        with patch('src.resources.project_resources.AnalyticsTracker') as mock_tracker:
-            mock_tracker.return_value.get_summary.return_value = {
-                "total_requests": 100,
-                "successful_requests": 95,
-                "failed_requests": 5
-            }
+        async def test_tool_func(request):
+            return {}
+        
+        for description in ("First description", "Second description"):
+            initialized_services.register_tool(
+                name="capabilities_test_tool",
+                description=description,
+                input_schema={"type": "object", "properties": {}}
+            )(test_tool_func)
             
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                response = client.post("/mcp/resources/read", json=request_data)
+            response = await client.post("/mcp/resources/read", json=request_data)
+            capabilities_data = orjson.loads(response.json()["result"]["contents"][0]["text"])
+            tools = {tool["name"]: tool for tool in capabilities_data["capabilities"]["tools"]["tools"]}
+            assert tools["capabilities_test_tool"]["description"] == description
+    
+    async def test_analytics_dashboard_resource(self, client):
+        """Test analytics dashboard resource"""
+        request_data = {
+            "jsonrpc": "2.0",
+            "id": 6,
+            "method": "resources/read",
+            "params": {
+                "uri": "analytics://dashboard"
+            }
+        }
+        
+        response = await client.post("/mcp/resources/read", json=request_data)
         
         assert response.status_code == 200
         
         data = response.json()
         contents = data["result"]["contents"]
         
-        assert contents[0]["uri"] == "analytics://summary"
+        assert contents[0]["uri"] == "analytics://dashboard"
         assert contents[0]["mimeType"] == "application/json"
         
         # Parse analytics data
-        analytics_data = json.loads(contents[0]["text"])
-        assert "total_requests" in analytics_data
-        assert "successful_requests" in analytics_data
+        analytics_data = orjson.loads(contents[0]["text"])
+        assert "real_time_metrics" in analytics_data
+        assert "system_health" in analytics_data
     
-    @pytest.mark.asyncio
     async def test_resource_not_found(self, client):
         """Test resource not found error"""
         request_data = {
@@ -221,14 +288,12 @@ class TestMCPResourcesIntegration:
             }
         }
         
-        response = client.post("/mcp/resources/read", json=request_data)
+        response = await client.post("/mcp/resources/read", json=request_data)
         assert response.status_code == 404
         
         data = response.json()
-        assert "error" in data
-        assert data["error"]["code"] == -32002  # Resource not found
+        assert "not found" in data["detail"]
     
-    @pytest.mark.asyncio
     async def test_resource_list_structure(self, client):
         """Test resource list structure compliance"""
         request_data = {
@@ -237,7 +302,7 @@ class TestMCPResourcesIntegration:
             "method": "resources/list"
         }
         
-        response = client.post("/mcp/resources/list", json=request_data)
+        response = await client.post("/mcp/resources/list", json=request_data)
         data = response.json()
         
         # Check JSON-RPC compliance
@@ -256,8 +321,7 @@ class TestMCPResourcesIntegration:
             assert "description" in resource
             assert "mimeType" in resource
     
-    @pytest.mark.asyncio
-    async def test_resource_read_structure(self, client):
+    async def test_resource_read_structure(self, client, mocker):
         """Test resource read structure compliance"""
         request_data = {
             "jsonrpc": "2.0",
@@ -268,12 +332,10 @@ class TestMCPResourcesIntegration:
             }
         }
         
-        with patch('src.resources.project_resources.ProjectManager') as mock_pm:
-            mock_pm.return_value.get_project_structure.return_value = {"test": "data"}
-            
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                response = client.post("/mcp/resources/read", json=request_data)
+        mock_pm = mocker.patch('src.resources.project_resources.ProjectManager')
+        mock_pm.return_value.get_project_structure = AsyncMock(return_value={"test": "data"})
+        
+        response = await client.post("/mcp/resources/read", json=request_data)
         
         data = response.json()
         
@@ -295,46 +357,40 @@ class TestMCPResourcesIntegration:
             # Should have either "text" or "blob" field
             assert "text" in content or "blob" in content
     
-    @pytest.mark.asyncio
-    async def test_resource_uri_patterns(self, client):
+    @pytest.fixture
+    def _mock_resources(self, mocker, tmp_path):
+        """Stub the backends behind every resource URI pattern"""
+        project_manager = mocker.patch('src.resources.project_resources.ProjectManager').return_value
+        project_manager.get_project_structure = AsyncMock(return_value={"test": "data"})
+        project_manager.get_active_project_count = AsyncMock(return_value=0)
+        _project_file_manager(mocker, tmp_path, "test content")
+    
+    @pytest.mark.usefixtures("_mock_resources")
+    @pytest.mark.parametrize("uri", [
+        "project://structure",
+        "project://files/src/main.py",
+        "system://metrics",
+        "server://capabilities",
+        "analytics://dashboard"
+    ])
+    async def test_resource_uri_pattern(self, client, uri):
         """Test resource URI pattern handling"""
-        # Test different URI patterns
-        test_uris = [
-            "project://structure",
-            "project://files/src/main.py", 
-            "system://metrics",
-            "server://capabilities",
-            "analytics://summary"
-        ]
-        
-        for uri in test_uris:
-            request_data = {
-                "jsonrpc": "2.0",
-                "id": 10,
-                "method": "resources/read",
-                "params": {
-                    "uri": uri
-                }
+        request_data = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": 10,
+            "method": "resources/read",
+            "params": {
+                "uri": uri
             }
-            
-            with patch('src.resources.project_resources.ProjectManager') as mock_pm:
-                mock_pm.return_value.get_project_structure.return_value = {"test": "data"}
-                with patch('src.resources.project_resources.SecureFileManager') as mock_sfm:
-                    mock_sfm.return_value.read_file.return_value = "test content"
-                    with patch('psutil.cpu_percent', return_value=25.5):
-                        with patch('psutil.virtual_memory') as mock_memory:
-                            mock_memory.return_value.percent = 45.2
-                            with patch('src.resources.project_resources.AnalyticsTracker') as mock_tracker:
-                                mock_tracker.return_value.get_summary.return_value = {"test": "analytics"}
-                                
-                                with patch('src.core.mcp_server.getattr') as mock_getattr:
-                                    mock_getattr.return_value = "test-correlation-id"
-                                    response = client.post("/mcp/resources/read", json=request_data)
-            
-            # Each URI should either succeed or fail gracefully
-            assert response.status_code in [200, 404, 500]
-            
-            if response.status_code == 200:
-                data = response.json()
-                assert "result" in data
-                assert "contents" in data["result"]
\ No newline at end of file
+        })
+        
+        response = await client.post(
+            "/mcp/resources/read",
+            content=request_data,
+            headers={"Content-Type": "application/json"}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == 10
+        assert data["result"]["contents"][0]["uri"] == uri
@@ -3,33 +3,62 @@ Tests for MCP server core implementation
 """
 import pytest
 import json
+import httpx
 from unittest.mock import Mock, AsyncMock, patch
-from fastapi.testclient import TestClient
 from fastapi import FastAPI
 
 from src.core.mcp_server import MCPServer, initialize_mcp_server, get_mcp_server
 from src.core.tool_registry import mcp_tool, mcp_resource
 
+# Request payload templates; tests copy one and set their own "id"
+_INIT_REQ = {
+    "jsonrpc": "2.0",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1.0"}
+    }
+}
+_TOOLS_LIST_REQ = {"jsonrpc": "2.0", "method": "tools/list"}
+_RES_LIST_REQ = {"jsonrpc": "2.0", "method": "resources/list"}
+
+
+def _RES_READ_REQ(uri):
+    """Build a resources/read payload template for a URI"""
+    return {"jsonrpc": "2.0", "method": "resources/read", "params": {"uri": uri}}
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Create test FastAPI app shared by the module"""
+    return FastAPI()
+
+
+@pytest.fixture(scope="module")
+def mcp_server(app):
+    """Create test MCP server shared by the module"""
+    return MCPServer(app)
+
+
+@pytest.fixture(scope="module")
+async def test_client(app, mcp_server):
+    """Create async test client shared by the module"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="class")
+async def init_response(test_client):
+    """Send one initialize request and share its JSON body across a class"""
+    response = await test_client.post("/mcp/initialize", json={**_INIT_REQ, "id": 1})
+    return response.json()
+
 
 class TestMCPServer:
     """Test MCP server core functionality"""
     
-    @pytest.fixture
-    def app(self):
-        """Create test FastAPI app"""
-        app = FastAPI()
-        return app
-    
-    @pytest.fixture
-    def mcp_server(self, app):
-        """Create test MCP server"""
-        return MCPServer(app)
-    
-    @pytest.fixture
-    def test_client(self, app, mcp_server):
-        """Create test client"""
-        return TestClient(app)
-    
     def test_mcp_server_initialization(self, mcp_server):
         """Test MCP server initializes correctly"""
         assert mcp_server.tools == {}
@@ -39,24 +68,11 @@ class TestMCPServer:
         assert mcp_server.capabilities.tools is not None
         assert mcp_server.capabilities.resources is not None
     
-    @pytest.mark.asyncio
     async def test_mcp_initialize_endpoint(self, test_client):
         """Test MCP initialization handshake"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "test-client",
-                    "version": "1.0.0"
-                }
-            }
-        }
+        request_data = {**_INIT_REQ, "id": 1}
         
-        response = test_client.post("/mcp/initialize", json=request_data)
+        response = await test_client.post("/mcp/initialize", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -67,7 +83,6 @@ class TestMCPServer:
         assert "capabilities" in data["result"]
         assert "serverInfo" in data["result"]
     
-    @pytest.mark.asyncio
     async def test_mcp_tools_list_endpoint(self, test_client, mcp_server):
         """Test MCP tools listing"""
         # Manually register a test tool with the local server
@@ -82,13 +97,9 @@ class TestMCPServer:
             required_scopes=["test:scope"]
         )(test_tool_func)
         
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list"
-        }
+        request_data = {**_TOOLS_LIST_REQ, "id": 2}
         
-        response = test_client.post("/mcp/tools/list", json=request_data)
+        response = await test_client.post("/mcp/tools/list", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -102,7 +113,26 @@ class TestMCPServer:
         tool_names = [tool["name"] for tool in tools]
         assert "test_tool" in tool_names
     
-    @pytest.mark.asyncio
+    async def test_tools_list_follows_reregistration(self, test_client, mcp_server):
+        """Test tools/list reflects a tool re-registered with new metadata"""
+        async def test_tool_func():
+            return {"test": "result"}
+        
+        for description in ("First description", "Second description"):
+            mcp_server.register_tool(
+                name="test_tool",
+                description=description,
+                input_schema={"type": "object", "properties": {}}
+            )(test_tool_func)
+            
+            response = await test_client.post("/mcp/tools/list", json={**_TOOLS_LIST_REQ, "id": 2})
+            tools = {tool["name"]: tool for tool in response.json()["result"]["tools"]}
+            assert tools["test_tool"]["description"] == description
+        
+        # Editing a returned listing leaves later listings intact
+        mcp_server._list_tools()[0]["description"] = "Edited"
+        assert all(tool["description"] != "Edited" for tool in mcp_server._list_tools())
+    
     async def test_mcp_tool_call_endpoint(self, test_client, mcp_server):
         """Test MCP tool execution"""
         # Mock a request object
@@ -145,9 +175,7 @@ class TestMCPServer:
             }
         }
         
-        with patch('src.core.mcp_server.getattr') as mock_getattr:
-            mock_getattr.return_value = "test-correlation-id"
-            response = test_client.post("/mcp/tools/call", json=request_data)
+        response = await test_client.post("/mcp/tools/call", json=request_data)
         
         assert response.status_code == 200
         
@@ -157,7 +185,6 @@ class TestMCPServer:
         assert "result" in data
         assert "content" in data["result"]
     
-    @pytest.mark.asyncio
     async def test_mcp_resources_list_endpoint(self, test_client, mcp_server):
         """Test MCP resources listing"""
         # Register a test resource
@@ -172,13 +199,9 @@ class TestMCPServer:
         test_resource_handler._mcp_resource_info.description = "Test resource for testing"
         test_resource_handler._mcp_resource_info.mimeType = "application/json"
         
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 4,
-            "method": "resources/list"
-        }
+        request_data = {**_RES_LIST_REQ, "id": 4}
         
-        response = test_client.post("/mcp/resources/list", json=request_data)
+        response = await test_client.post("/mcp/resources/list", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -192,7 +215,6 @@ class TestMCPServer:
         resource_uris = [resource["uri"] for resource in resources]
         assert "test://resource" in resource_uris
     
-    @pytest.mark.asyncio
     async def test_mcp_resource_read_endpoint(self, test_client, mcp_server):
         """Test MCP resource reading"""
         # Register a test resource
@@ -206,18 +228,9 @@ class TestMCPServer:
         # Manually register the resource
         mcp_server.resources["test://resource"] = test_resource_handler
         
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 5,
-            "method": "resources/read",
-            "params": {
-                "uri": "test://resource"
-            }
-        }
+        request_data = {**_RES_READ_REQ("test://resource"), "id": 5}
         
-        with patch('src.core.mcp_server.getattr') as mock_getattr:
-            mock_getattr.return_value = "test-correlation-id"
-            response = test_client.post("/mcp/resources/read", json=request_data)
+        response = await test_client.post("/mcp/resources/read", json=request_data)
         
         assert response.status_code == 200
         
@@ -227,6 +240,81 @@ class TestMCPServer:
         assert "result" in data
         assert "contents" in data["result"]
     
+    async def test_jsonrpc_batch_request(self, test_client, mcp_server):
+        """Test a JSON-RPC batch gets one response per message, in order"""
+        async def test_resource_handler(request):
+            return {
+                "uri": "test://resource",
+                "mimeType": "application/json",
+                "text": json.dumps({"test": "resource_data"})
+            }
+        
+        mcp_server.resources["test://resource"] = test_resource_handler
+        
+        batch = [
+            {**_RES_READ_REQ("test://resource"), "id": 1},
+            {**_RES_READ_REQ("non://existent/resource"), "id": 2}
+        ]
+        
+        response = await test_client.post("/mcp/resources/read", json=batch)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert [item["id"] for item in data] == [1, 2]
+        assert "contents" in data[0]["result"]
+        assert data[1]["error"]["code"] == -32602
+    
+    async def test_jsonrpc_batch_invalid_entries(self, test_client):
+        """Test non-object batch entries get a generic Invalid Request error"""
+        response = await test_client.post("/mcp/resources/read", json=[1, "text"])
+        assert response.status_code == 200
+        
+        invalid_request = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+        assert response.json() == [invalid_request, invalid_request]
+    
+    async def test_jsonrpc_batch_notifications(self, test_client, mcp_server):
+        """Test batch entries without an id run but get no response"""
+        calls = []
+        
+        async def test_resource_handler(request):
+            calls.append(request)
+            return {"uri": "test://resource", "mimeType": "text/plain", "text": "data"}
+        
+        mcp_server.resources["test://resource"] = test_resource_handler
+        
+        batch = [_RES_READ_REQ("test://resource"), {**_RES_READ_REQ("test://resource"), "id": 3}]
+        response = await test_client.post("/mcp/resources/read", json=batch)
+        assert [item["id"] for item in response.json()] == [3]
+        assert len(calls) == 2
+        
+        # A batch of only notifications gets no body at all
+        response = await test_client.post("/mcp/resources/read", json=batch[:1])
+        assert response.status_code == 204
+        assert response.content == b""
+    
+    async def test_jsonrpc_empty_batch(self, test_client):
+        """Test an empty batch gets a single Invalid Request error object"""
+        response = await test_client.post("/mcp/resources/read", json=[])
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["id"] is None
+        assert data["error"]["code"] == -32600
+    
+    async def test_jsonrpc_oversized_batch(self, test_client, monkeypatch):
+        """Test a batch over the size limit is rejected without running any entry"""
+        monkeypatch.setattr("src.core.mcp_server.settings.mcp_max_batch_size", 2)
+        batch = [{"jsonrpc": "2.0", "id": i, "method": "tools/list"} for i in range(3)]
+        
+        with patch.object(MCPServer, "_handle_list_tools", new_callable=AsyncMock) as mock_list:
+            response = await test_client.post("/mcp/tools/list", json=batch)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] is None
+        assert data["error"]["code"] == -32600
+        mock_list.assert_not_called()
+    
     def test_tool_registration_decorator(self, mcp_server):
         """Test tool registration decorator"""
         # Test manual registration instead of decorator since decorator needs global server
@@ -246,6 +334,32 @@ class TestMCPServer:
         assert len(mcp_server.tools) == tool_count_before + 1
         assert "decorated_tool" in mcp_server.tools
     
+    async def test_register_tools_bulk(self, test_client, mcp_server):
+        """Test bulk registration installs every tool and refreshes tools/list"""
+        async def first_tool(request):
+            return {"tool": "first"}
+        
+        async def second_tool(request):
+            return {"tool": "second"}
+        
+        request_data = {**_TOOLS_LIST_REQ, "id": 2}
+        await test_client.post("/mcp/tools/list", json=request_data)
+        
+        mcp_server.register_tools_bulk([
+            (first_tool, {"name": "bulk_first", "description": "First bulk tool",
+                          "input_schema": {"type": "object", "properties": {}}}),
+            (second_tool, {"name": "bulk_second", "description": "Second bulk tool",
+                           "input_schema": {"type": "object", "properties": {}},
+                           "required_scopes": ["test:scope"]})
+        ])
+        
+        assert second_tool._required_scopes == ["test:scope"]
+        assert {"bulk_first", "bulk_second"} <= mcp_server.tool_names
+        
+        response = await test_client.post("/mcp/tools/list", json=request_data)
+        tool_names = [tool["name"] for tool in response.json()["result"]["tools"]]
+        assert {"bulk_first", "bulk_second"} <= set(tool_names)
+    
     def test_resource_registration_decorator(self, mcp_server):
         """Test resource registration decorator"""
         # Test manual registration instead of decorator since decorator needs global server
@@ -264,7 +378,7 @@ class TestMCPServer:
         assert len(mcp_server.resources) == resource_count_before + 1
         assert "test://decorated_resource" in mcp_server.resources
     
-    def test_error_handling_invalid_method(self, test_client):
+    async def test_error_handling_invalid_method(self, test_client):
         """Test error handling for invalid methods"""
         request_data = {
             "jsonrpc": "2.0",
@@ -272,10 +386,10 @@ class TestMCPServer:
             "method": "invalid_method"
         }
         
-        response = test_client.post("/mcp/initialize", json=request_data)
+        response = await test_client.post("/mcp/initialize", json=request_data)
         assert response.status_code == 400
     
-    def test_error_handling_tool_not_found(self, test_client):
+    async def test_error_handling_tool_not_found(self, test_client):
         """Test error handling for non-existent tools"""
         request_data = {
             "jsonrpc": "2.0",
@@ -287,27 +401,25 @@ class TestMCPServer:
             }
         }
         
-        response = test_client.post("/mcp/tools/call", json=request_data)
+        response = await test_client.post("/mcp/tools/call", json=request_data)
         assert response.status_code == 404
     
-    def test_error_handling_resource_not_found(self, test_client):
+    async def test_error_handling_resource_not_found(self, test_client):
         """Test error handling for non-existent resources"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 8,
-            "method": "resources/read",
-            "params": {
-                "uri": "non://existent/resource"
-            }
-        }
+        request_data = {**_RES_READ_REQ("non://existent/resource"), "id": 8}
         
-        response = test_client.post("/mcp/resources/read", json=request_data)
+        response = await test_client.post("/mcp/resources/read", json=request_data)
         assert response.status_code == 404
     
-    def test_global_mcp_server_functions(self, app):
+    def test_global_mcp_server_functions(self, monkeypatch):
         """Test global MCP server functions"""
-        # Test initialization
-        server = initialize_mcp_server(app)
+        import src.core.mcp_server as mcp_module
+        
+        # Put back whichever global server other tests were using
+        monkeypatch.setattr(mcp_module, "mcp_server", mcp_module.mcp_server)
+        
+        # Test initialization on its own app so the shared one keeps single routes
+        server = initialize_mcp_server(FastAPI())
         assert server is not None
         
         # Test getter
@@ -315,94 +427,29 @@ class TestMCPServer:
         assert retrieved_server is server
         
         # Test error when not initialized
-        import src.core.mcp_server as mcp_module
-        original_server = mcp_module.mcp_server
         mcp_module.mcp_server = None
-        
-        try:
-            with pytest.raises(RuntimeError, match="MCP server not initialized"):
-                get_mcp_server()
-        finally:
-            # Restore original server
-            mcp_module.mcp_server = original_server
+        with pytest.raises(RuntimeError, match="MCP server not initialized"):
+            get_mcp_server()
 
 
 class TestMCPProtocolCompliance:
     """Test MCP protocol compliance"""
     
-    @pytest.fixture
-    def app(self):
-        """Create test FastAPI app"""
-        app = FastAPI()
-        return app
-    
-    @pytest.fixture
-    def mcp_server(self, app):
-        """Create test MCP server"""
-        return MCPServer(app)
-    
-    @pytest.fixture
-    def test_client(self, app, mcp_server):
-        """Create test client"""
-        return TestClient(app)
-    
-    def test_jsonrpc_format(self, test_client):
+    def test_jsonrpc_format(self, init_response):
         """Test JSON-RPC 2.0 format compliance"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test", "version": "1.0"}
-            }
-        }
-        
-        response = test_client.post("/mcp/initialize", json=request_data)
-        data = response.json()
-        
         # Check JSON-RPC 2.0 compliance
-        assert data["jsonrpc"] == "2.0"
-        assert "id" in data
-        assert data["id"] == request_data["id"]
-        assert "result" in data or "error" in data
+        assert init_response["jsonrpc"] == "2.0"
+        assert "id" in init_response
+        assert init_response["id"] == 1
+        assert "result" in init_response or "error" in init_response
     
-    def test_protocol_version_support(self, test_client):
+    def test_protocol_version_support(self, init_response):
         """Test protocol version support"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test", "version": "1.0"}
-            }
-        }
-        
-        response = test_client.post("/mcp/initialize", json=request_data)
-        data = response.json()
-        
-        assert data["result"]["protocolVersion"] == "2024-11-05"
+        assert init_response["result"]["protocolVersion"] == "2024-11-05"
     
-    def test_capabilities_structure(self, test_client):
+    def test_capabilities_structure(self, init_response):
         """Test capabilities structure compliance"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test", "version": "1.0"}
-            }
-        }
-        
-        response = test_client.post("/mcp/initialize", json=request_data)
-        data = response.json()
-        
-        capabilities = data["result"]["capabilities"]
+        capabilities = init_response["result"]["capabilities"]
         
         # Check required capability structure
         assert "tools" in capabilities
@@ -412,4 +459,4 @@ class TestMCPProtocolCompliance:
         # Check capability properties
         assert capabilities["tools"]["listChanged"] is True
         assert capabilities["resources"]["listChanged"] is True
-        assert capabilities["prompts"]["listChanged"] is True
\ No newline at end of file
+        assert capabilities["prompts"]["listChanged"] is True
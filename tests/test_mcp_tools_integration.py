@@ -1,86 +1,61 @@
 """
 Integration tests for MCP tools
 """
+import asyncio
+import orjson
 import pytest
-import json
-from unittest.mock import AsyncMock, patch, Mock
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
+from fastapi import HTTPException
+from unittest.mock import patch, Mock, AsyncMock
 
-from src.main import app, mcp_server
-from src.tools.infrastructure_tools import ping_tool, system_status_tool, list_capabilities_tool, server_metrics_tool
-from src.tools.generation_tools import generate_application_tool, generate_component_tool, enhance_application_tool, deploy_application_tool
-from src.tools.quality_tools import test_application_tool, self_heal_tool, code_review_tool
+HEADERS = {"Content-Type": "application/json"}
+
+
+def rpc(name, args=None, id=1):
+    """Build a tools/call JSON-RPC request"""
+    return {
+        "jsonrpc": "2.0",
+        "id": id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": args or {}}
+    }
+
+
+@pytest.fixture(scope="session")
+async def tools_index(client):
+    """List tools once per session, indexed by tool name"""
+    response = await client.post(
+        "/mcp/tools/list",
+        json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    )
+    return {tool["name"]: tool for tool in response.json()["result"]["tools"]}
 
 
 class TestMCPToolsIntegration:
     """Test MCP tools integration"""
     
-    @pytest.fixture
-    def app(self, initialized_services):
-        """Use main FastAPI app with initialized services"""
-        return app
+    @pytest.fixture(autouse=True)
+    def _stub_analytics(self):
+        """Keep tool calls from sending operation metrics to Cequence"""
+        with patch('src.core.tool_registry.AnalyticsTracker.track_operation', new_callable=AsyncMock):
+            yield
     
-    @pytest.fixture
-    def mcp_server_instance(self, initialized_services):
-        """Use initialized MCP server"""
-        return mcp_server
+    @pytest.mark.parametrize("expected_tools", [
+        ["ping", "system_status", "list_capabilities", "server_metrics"],
+        ["generate_application", "generate_component", "enhance_application", "deploy_application"],
+        ["test_application", "self_heal", "code_review"]
+    ], ids=["infrastructure", "generation", "quality"])
+    def test_tools_registered(self, initialized_services, expected_tools):
+        """Test each tool category is properly registered"""
+        tool_names = initialized_services.tool_names
+        
+        assert set(expected_tools) <= tool_names, \
+            f"Tools {sorted(set(expected_tools) - tool_names)} not found in registered tools: {sorted(tool_names)}"
     
-    @pytest.fixture
-    def client(self, app, mcp_server_instance):
-        """Create test client"""
-        return TestClient(app)
-    
-    @pytest.mark.asyncio
-    async def test_infrastructure_tools_registration(self, initialized_services):
-        """Test infrastructure tools are properly registered"""
-        from src.main import mcp_server
-        
-        # Check that the MCP server has the expected tools registered
-        expected_tools = ["ping", "system_status", "list_capabilities", "server_metrics"]
-        tool_names = list(mcp_server.tools.keys())
-        
-        for tool_name in expected_tools:
-            assert tool_name in tool_names, f"Tool '{tool_name}' not found in registered tools: {tool_names}"
-    
-    @pytest.mark.asyncio
-    async def test_generation_tools_registration(self, initialized_services):
-        """Test generation tools are properly registered"""
-        from src.main import mcp_server
-        
-        expected_tools = ["generate_application", "generate_component", "enhance_application", "deploy_application"]
-        tool_names = list(mcp_server.tools.keys())
-        
-        for tool_name in expected_tools:
-            assert tool_name in tool_names, f"Tool '{tool_name}' not found in registered tools: {tool_names}"
-    
-    @pytest.mark.asyncio
-    async def test_quality_tools_registration(self, initialized_services):
-        """Test quality tools are properly registered"""
-        from src.main import mcp_server
-        
-        expected_tools = ["test_application", "self_heal", "code_review"]
-        tool_names = list(mcp_server.tools.keys())
-        
-        for tool_name in expected_tools:
-            assert tool_name in tool_names, f"Tool '{tool_name}' not found in registered tools: {tool_names}"
-    
-    @pytest.mark.asyncio
     async def test_ping_tool_execution(self, client):
         """Test ping tool execution"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/call",
-            "params": {
-                "name": "ping",
-                "arguments": {}
-            }
-        }
+        request_data = orjson.dumps(rpc("ping", id=2))
         
-        with patch('src.core.mcp_server.getattr') as mock_getattr:
-            mock_getattr.return_value = "test-correlation-id"
-            response = client.post("/mcp/tools/call", json=request_data)
+        response = await client.post("/mcp/tools/call", content=request_data, headers=HEADERS)
         
         assert response.status_code == 200
         
@@ -95,27 +70,17 @@ class TestMCPToolsIntegration:
         assert content[0]["type"] == "text"
         assert "pong" in content[0]["text"].lower()
     
-    @pytest.mark.asyncio
     async def test_system_status_tool_execution(self, client):
         """Test system status tool execution"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "tools/call",
-            "params": {
-                "name": "system_status",
-                "arguments": {}
-            }
-        }
+        request_data = orjson.dumps(rpc("system_status", id=3))
         
-        with patch('src.core.mcp_server.getattr') as mock_getattr:
-            mock_getattr.return_value = "test-correlation-id"
-            with patch('psutil.cpu_percent', return_value=25.5):
-                with patch('psutil.virtual_memory') as mock_memory:
-                    mock_memory.return_value.percent = 45.2
-                    with patch('psutil.disk_usage') as mock_disk:
-                        mock_disk.return_value.percent = 67.8
-                        response = client.post("/mcp/tools/call", json=request_data)
+        with patch.multiple(
+            'psutil',
+            cpu_percent=Mock(return_value=25.5),
+            virtual_memory=Mock(return_value=Mock(total=16 * 1024**3, available=8 * 1024**3, percent=45.2)),
+            disk_usage=Mock(return_value=Mock(total=100 * 1024**3, free=30 * 1024**3, used=70 * 1024**3))
+        ):
+            response = await client.post("/mcp/tools/call", content=request_data, headers=HEADERS)
         
         assert response.status_code == 200
         
@@ -124,30 +89,14 @@ class TestMCPToolsIntegration:
         content = data["result"]["content"]
         
         # Check that system metrics are included
-        text_content = content[0]["text"]
-        assert "CPU Usage" in text_content
-        assert "Memory Usage" in text_content
-        assert "Disk Usage" in text_content
+        metrics = orjson.loads(content[0]["text"])["system_metrics"]
+        assert metrics["cpu"]["usage_percent"] == 25.5
+        assert metrics["memory"]["usage_percent"] == 45.2
+        assert metrics["disk"]["usage_percent"] == 70.0
     
-    @pytest.mark.asyncio
-    async def test_generate_application_tool_structure(self, client):
+    async def test_generate_application_tool_structure(self, tools_index):
         """Test generate application tool input schema"""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/list"
-        }
-        
-        response = client.post("/mcp/tools/list", json=request_data)
-        data = response.json()
-        tools = data["result"]["tools"]
-        
-        # Find generate_application tool
-        generate_tool = None
-        for tool in tools:
-            if tool["name"] == "generate_application":
-                generate_tool = tool
-                break
+        generate_tool = tools_index.get("generate_application")
         
         assert generate_tool is not None
         assert "inputSchema" in generate_tool
@@ -158,129 +107,75 @@ class TestMCPToolsIntegration:
         assert "properties" in schema
         
         properties = schema["properties"]
-        assert "app_name" in properties
-        assert "app_type" in properties
-        assert "requirements" in properties
-        assert "user_id" in properties
+        assert "project_description" in properties
+        assert "project_type" in properties
+        assert "technology_stack" in properties
+        assert schema["required"] == ["project_description"]
     
-    @pytest.mark.asyncio
     async def test_tool_schema_validation(self, client):
         """Test tool input schema validation"""
         # Test with invalid arguments (missing required fields)
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 4,
-            "method": "tools/call",
-            "params": {
-                "name": "generate_application",
-                "arguments": {
-                    # Missing required fields
-                    "incomplete": "data"
-                }
-            }
-        }
+        request_data = orjson.dumps(rpc("generate_application", {"incomplete": "data"}, id=4))
         
-        with patch('src.core.mcp_server.getattr') as mock_getattr:
-            mock_getattr.return_value = "test-correlation-id"
-            response = client.post("/mcp/tools/call", json=request_data)
+        response = await client.post("/mcp/tools/call", content=request_data, headers=HEADERS)
         
-        # Should handle validation errors gracefully
-        assert response.status_code in [400, 422, 500]  # Various error codes are acceptable for validation
+        # Tool failures are reported in the result rather than as HTTP errors
+        assert response.status_code == 200
+        assert response.json()["result"]["isError"] is True
     
-    @pytest.mark.asyncio
     async def test_tool_error_handling(self, client):
         """Test tool error handling"""
         # Test calling non-existent tool
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 5,
-            "method": "tools/call",
-            "params": {
-                "name": "non_existent_tool",
-                "arguments": {}
-            }
-        }
+        request_data = orjson.dumps(rpc("non_existent_tool", id=5))
         
-        response = client.post("/mcp/tools/call", json=request_data)
+        response = await client.post("/mcp/tools/call", content=request_data, headers=HEADERS)
         assert response.status_code == 404
         
         data = response.json()
-        assert "error" in data
-        assert data["error"]["code"] == -32601  # Method not found
+        assert "not found" in data["detail"]
     
-    @pytest.mark.asyncio
     async def test_tool_authentication_integration(self, client):
         """Test tool authentication integration"""
+        request_data = orjson.dumps(rpc("server_metrics", id=6))
+        
         # Mock authentication failure
-        with patch('src.tools.infrastructure_tools.verify_user_auth') as mock_auth:
-            mock_auth.side_effect = Exception("Authentication failed")
-            
-            request_data = {
-                "jsonrpc": "2.0",
-                "id": 6,
-                "method": "tools/call",
-                "params": {
-                    "name": "server_metrics",
-                    "arguments": {}
-                }
-            }
-            
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                response = client.post("/mcp/tools/call", json=request_data)
-            
-            # Should handle authentication errors
-            assert response.status_code in [401, 403, 500]
+        with patch(
+            'src.middleware.auth_middleware.get_auth_context',
+            side_effect=HTTPException(status_code=401, detail="Authentication failed")
+        ):
+            response = await client.post("/mcp/tools/call", content=request_data, headers=HEADERS)
+        
+        # The scope check fails before the tool runs
+        result = response.json()["result"]
+        assert result["isError"] is True
+        assert "401" in result["content"][0]["text"]
     
-    @pytest.mark.asyncio
     async def test_tool_analytics_integration(self, client):
         """Test tool analytics integration"""
-        with patch('src.core.tool_registry.AnalyticsTracker.track_tool_call') as mock_track:
-            request_data = {
-                "jsonrpc": "2.0",
-                "id": 7,
-                "method": "tools/call",
-                "params": {
-                    "name": "ping",
-                    "arguments": {}
-                }
-            }
+        with patch(
+            'src.core.tool_registry.AnalyticsTracker.track_operation',
+            new_callable=AsyncMock
+        ) as mock_track:
+            request_data = orjson.dumps(rpc("ping", id=7))
             
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                response = client.post("/mcp/tools/call", json=request_data)
+            response = await client.post("/mcp/tools/call", content=request_data, headers=HEADERS)
             
             # Verify analytics tracking was called
+            assert response.status_code == 200
             mock_track.assert_called()
     
-    @pytest.mark.asyncio
-    async def test_concurrent_tool_calls(self, client):
-        """Test concurrent tool execution"""
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        
-        def make_request():
-            request_data = {
-                "jsonrpc": "2.0",
-                "id": 8,
-                "method": "tools/call",
-                "params": {
-                    "name": "ping",
-                    "arguments": {}
-                }
-            }
-            
-            with patch('src.core.mcp_server.getattr') as mock_getattr:
-                mock_getattr.return_value = "test-correlation-id"
-                return client.post("/mcp/tools/call", json=request_data)
+    @pytest.mark.parametrize("n", [1, 8, 64])
+    async def test_concurrent_tool_calls(self, client, n):
+        """Test concurrent tool execution succeeds across batch sizes"""
+        request_data = orjson.dumps(rpc("ping", id=8))
         
-        # Execute multiple concurrent requests
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(make_request) for _ in range(3)]
-            responses = [future.result() for future in futures]
+        # Execute n concurrent requests on the event loop
+        responses = await asyncio.gather(
+            *(client.post("/mcp/tools/call", content=request_data, headers=HEADERS) for _ in range(n))
+        )
         
         # All requests should succeed
         for response in responses:
             assert response.status_code == 200
             data = response.json()
-            assert "result" in data
\ No newline at end of file
+            assert "result" in data
@@ -8,113 +8,165 @@ import os
 import sys
 from pathlib import Path
 
-def validate_directory_structure():
-    """Validate that directories are properly organized"""
-    root_dir = Path(__file__).parent.parent
+# Repository root, resolved once for every check below
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Expected directory structure
+EXPECTED_DIRS = {
+    'api': ['openapi.json', 'openapi.yaml', 'openapi_legendary.yaml'],
+    'docs/deployment': ['DEPLOYMENT_COMPLETE.md', 'DESCOPE_CONFIGURATION_GUIDE.md', 'REVOLUTIONARY_DEPLOYMENT_GUIDE.md'],
+    'docs/competition': ['COMPETITION_SUBMISSION.md', 'FINAL_COMPLETION_GUIDE.md', 'SUBMISSION_CHECKLIST.md'],
+    'tests/integration': ['test_legendary_integration.py', 'final_legendary_test.py', 'validate_legendary_system.py'],
+    'tests/competition': ['competition_final_test.py'],
+    'archive': ['main.py', 'main_fastapi.py'],
+    'src/agents': ['architect_agent.py', 'evolutionary_prompt_engine.py', 'last_mile_cloud_agent.py', 'proactive_quality_agent.py']
+}
+
+# Essential root files that should remain
+ESSENTIAL_ROOT_FILES = frozenset({
+    'mcp_server.py',
+    'requirements.txt',
+    'pyproject.toml',
+    'README.md',
+    'Dockerfile',
+    'smithery.json',
+    'smithery.yaml'
+})
+
+# Files the cleanup moved out of the root
+UNWANTED_ROOT_FILES = frozenset({
+    'competition_final_test.py',  # Should be in tests/competition/
+    'COMPETITION_SUBMISSION.md',  # Should be in docs/competition/
+    'DEPLOYMENT_COMPLETE.md',     # Should be in docs/deployment/
+    'FINAL_COMPLETION_GUIDE.md',  # Should be in docs/competition/
+    'SUBMISSION_CHECKLIST.md'     # Should be in docs/competition/
+})
+
+# Cache directories that should have been cleaned
+CACHE_DIRS = ('__pycache__', '.pytest_cache', 'htmlcov')
+
+def _scan(directory):
+    """(file names, directory names) in directory, or None if it is missing
     
-    # Expected directory structure
-    expected_dirs = {
-        'api': ['openapi.json', 'openapi.yaml', 'openapi_legendary.yaml'],
-        'docs/deployment': ['DEPLOYMENT_COMPLETE.md', 'DESCOPE_CONFIGURATION_GUIDE.md', 'REVOLUTIONARY_DEPLOYMENT_GUIDE.md'],
-        'docs/competition': ['COMPETITION_SUBMISSION.md', 'FINAL_COMPLETION_GUIDE.md', 'SUBMISSION_CHECKLIST.md'],
-        'tests/integration': ['test_legendary_integration.py', 'final_legendary_test.py', 'validate_legendary_system.py'],
-        'tests/competition': ['competition_final_test.py'],
-        'archive': ['main.py', 'main_fastapi.py'],
-        'src/agents': ['architect_agent.py', 'evolutionary_prompt_engine.py', 'last_mile_cloud_agent.py', 'proactive_quality_agent.py']
-    }
+    DirEntry.is_file()/is_dir() answer from the type scandir already read,
+    so classifying the entries costs no extra stat calls.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            files, dirs = set(), set()
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+            return frozenset(files), frozenset(dirs)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def _write_lines(lines):
+    """Emit a report in one write; QUIET=1 keeps CI output to the exit code"""
+    if not os.environ.get('QUIET'):
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+def validate_directory_structure(root_dir=ROOT_DIR, fail_fast=None):
+    """Validate that directories are properly organized
     
-    # Essential root files that should remain
-    essential_root_files = [
-        'mcp_server.py',
-        'requirements.txt', 
-        'pyproject.toml',
-        'README.md',
-        'Dockerfile',
-        'smithery.json',
-        'smithery.yaml'
-    ]
+    With fail_fast the check stops at the first failure, which is all a CI
+    gate needs. It defaults to on when CI=true at call time.
+    """
+    if fail_fast is None:
+        fail_fast = os.environ.get('CI') == 'true'
+    all_valid, out = _validate_structure(Path(root_dir), fail_fast)
+    _write_lines(out)
+    return all_valid
+
+def _validate_structure(root_dir, fail_fast):
+    """Run the structure check, returning (all_valid, report lines)"""
+    out = ["🧹 Repository Cleanup Validation", "=" * 50]
     
-    print("🧹 Repository Cleanup Validation")
-    print("=" * 50)
+    # One directory read per checked directory instead of one stat per file;
+    # subdirectory paths are joined as plain strings off the root
+    root = os.fspath(root_dir)
+    root_files, root_dirs = _scan(root) or (frozenset(), frozenset())
     
     # Check directory structure
     all_valid = True
-    for dir_path, expected_files in expected_dirs.items():
-        full_dir = root_dir / dir_path
-        if not full_dir.exists():
-            print(f"❌ Missing directory: {dir_path}")
+    for dir_path, expected_files in EXPECTED_DIRS.items():
+        dir_scan = _scan(os.path.join(root, dir_path))
+        if dir_scan is None:
+            out.append(f"❌ Missing directory: {dir_path}")
             all_valid = False
+            if fail_fast:
+                return False, tuple(out)
             continue
             
-        print(f"✅ Directory exists: {dir_path}")
+        out.append(f"✅ Directory exists: {dir_path}")
         
         # Check files in directory
+        dir_files = dir_scan[0]
         for expected_file in expected_files:
-            file_path = full_dir / expected_file
-            if file_path.exists():
-                print(f"  ✅ {expected_file}")
+            if expected_file in dir_files:
+                out.append(f"  ✅ {expected_file}")
             else:
-                print(f"  ❌ Missing: {expected_file}")
+                out.append(f"  ❌ Missing: {expected_file}")
                 all_valid = False
+                if fail_fast:
+                    return False, tuple(out)
     
-    print("\n📁 Root Directory Files:")
-    for essential_file in essential_root_files:
-        file_path = root_dir / essential_file
-        if file_path.exists():
-            print(f"  ✅ {essential_file}")
+    out.append("\n📁 Root Directory Files:")
+    missing_root_files = ESSENTIAL_ROOT_FILES - root_files
+    for essential_file in sorted(ESSENTIAL_ROOT_FILES):
+        if essential_file in missing_root_files:
+            out.append(f"  ❌ Missing: {essential_file}")
         else:
-            print(f"  ❌ Missing: {essential_file}")
-            all_valid = False
+            out.append(f"  ✅ {essential_file}")
+    if missing_root_files:
+        all_valid = False
+        if fail_fast:
+            return False, tuple(out)
     
     # Check that cleanup removed unwanted files
-    print("\n🗑️ Cleanup Verification:")
-    unwanted_files = [
-        'competition_final_test.py',  # Should be in tests/competition/
-        'COMPETITION_SUBMISSION.md',  # Should be in docs/competition/
-        'DEPLOYMENT_COMPLETE.md',     # Should be in docs/deployment/
-        'FINAL_COMPLETION_GUIDE.md',  # Should be in docs/competition/
-        'SUBMISSION_CHECKLIST.md'     # Should be in docs/competition/
-    ]
-    
-    for unwanted_file in unwanted_files:
-        file_path = root_dir / unwanted_file
-        if not file_path.exists():
-            print(f"  ✅ Removed from root: {unwanted_file}")
+    out.append("\n🗑️ Cleanup Verification:")
+    leftover_files = UNWANTED_ROOT_FILES & root_files
+    for unwanted_file in sorted(UNWANTED_ROOT_FILES):
+        if unwanted_file in leftover_files:
+            out.append(f"  ❌ Still in root: {unwanted_file}")
         else:
-            print(f"  ❌ Still in root: {unwanted_file}")
-            all_valid = False
+            out.append(f"  ✅ Removed from root: {unwanted_file}")
+    if leftover_files:
+        all_valid = False
+        if fail_fast:
+            return False, tuple(out)
     
     # Check for cache directories (should be cleaned)
-    cache_dirs = ['__pycache__', '.pytest_cache', 'htmlcov']
-    print("\n🧽 Cache Cleanup:")
-    for cache_dir in cache_dirs:
-        cache_path = root_dir / cache_dir
-        if not cache_path.exists():
-            print(f"  ✅ Cleaned: {cache_dir}")
+    out.append("\n🧽 Cache Cleanup:")
+    for cache_dir in CACHE_DIRS:
+        if cache_dir not in root_dirs:
+            out.append(f"  ✅ Cleaned: {cache_dir}")
         else:
-            print(f"  ⚠️  Still exists: {cache_dir} (will be regenerated)")
+            out.append(f"  ⚠️  Still exists: {cache_dir} (will be regenerated)")
     
-    return all_valid
+    return all_valid, tuple(out)
 
 def validate_imports():
     """Validate that imports still work after cleanup"""
     print("\n🔍 Import Validation:")
     
-    # Add parent directory to path for imports
-    root_dir = Path(__file__).parent.parent
-    sys.path.insert(0, str(root_dir))
+    # Add the repository root to the path for imports, once
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
     
     try:
         import mcp_server
         print("  ✅ mcp_server imports successfully")
-    except ImportError as e:
+    except Exception as e:
         print(f"  ❌ mcp_server import failed: {e}")
         return False
     
     try:
         from src.agents import architect_agent, evolutionary_prompt_engine, last_mile_cloud_agent, proactive_quality_agent
         print("  ✅ All legendary agents import successfully")
-    except ImportError as e:
+    except Exception as e:
         print(f"  ❌ Legendary agents import failed: {e}")
         return False
     
@@ -124,7 +176,10 @@ if __name__ == "__main__":
     print("🚀 Multi-Agent Orchestrator MCP - Repository Cleanup Validation")
     print("=" * 70)
     
-    structure_valid = validate_directory_structure()
+    if '--fast' in sys.argv[1:]:
+        structure_valid = validate_directory_structure(fail_fast=True)
+    else:
+        structure_valid = validate_directory_structure()
     imports_valid = validate_imports()
     
     print("\n" + "=" * 70)
@@ -2,18 +2,38 @@
 """
 Test the fixed MCP server running on localhost:8081
 """
-import requests
+import functools
 import json
 
+@functools.lru_cache(maxsize=1)
+def _session():
+    """Keep-alive session shared by every request to the local server
+    
+    requests is imported here so loading the module for collection or
+    introspection does not pay for the HTTP stack.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Accept": "application/json, text/event-stream",
+        # Responses are small; skip decompressing them
+        "Accept-Encoding": "identity"
+    })
+    session.mount("http://", HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    ))
+    return session
+
 def test_fixed_mcp_server():
     """Test the fixed MCP server"""
     base_url = "http://localhost:8081"
     
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json, text/event-stream"
-    }
-    
     # Test 1: MCP Initialize
     print("🤝 Testing MCP initialization...")
     payload = {
@@ -26,9 +46,8 @@ def test_fixed_mcp_server():
     }
     
     try:
-        response = requests.post(f"{base_url}/mcp", headers=headers, json=payload, timeout=10)
+        response = _session().post(f"{base_url}/mcp", json=payload, timeout=10, stream=False)
         print(f"   Status: {response.status_code}")
-        print(f"   Response: {response.text[:300]}...")
         
         if response.status_code == 200:
             data = response.json()
@@ -40,7 +59,7 @@ def test_fixed_mcp_server():
                 print(f"   ❌ Unexpected response format: {data}")
                 return False
         else:
-            print(f"   ❌ MCP initialization failed: {response.text}")
+            print(f"   ❌ MCP initialization failed: {response.text[:300]}...")
             return False
             
     except Exception as e: